@@ -1,5 +1,5 @@
 from .contracts import DataContract, UserContract  # Import DataContract and any example contracts
-from .rules import Rule, RuleContext, StringLengthRule, StringRegexRule, NumberRangeRule, DateTimeFormatRule, BooleanRule, RequiredRule, JSONRule  # Import commonly used rules
+from .rules import Rule, RuleContext, AllOf, AnyOf, StringLengthRule, StringRegexRule, EmailRule, NumberRangeRule, DateTimeFormatRule, BooleanRule, RequiredRule, JSONRule, HyperscanRuleSet, cached_validate, invalidate_cached_results  # Import commonly used rules
 from .validator import Validator
 from .runner import TestRunner #Import test runner to enable running contracts
 
@@ -8,13 +8,19 @@ __all__ = [
     "UserContract",
     "Rule",
     "RuleContext",
+    "AllOf",
+    "AnyOf",
     "StringLengthRule",
     "StringRegexRule",
+    "EmailRule",
     "NumberRangeRule",
     "DateTimeFormatRule",
     "BooleanRule",
     "RequiredRule",
     "JSONRule",
+    "HyperscanRuleSet",
+    "cached_validate",
+    "invalidate_cached_results",
     "Validator",
     "TestRunner",
 ]
\ No newline at end of file
@@ -0,0 +1,396 @@
+import functools
+import typing as t
+from pyveritas.rules import (
+    _HAS_NUMPY,
+    _numpy,
+    _as_column,
+    Rule,
+    RuleContext,
+    RequiredRule,
+    StringRegexRule,
+    EmailRule,
+    StringLengthRule,
+    StringChoicesRule,
+    NumberRangeRule,
+    BooleanRule,
+    JSONRule,
+    TypeRule,
+    AllOf,
+    AnyOf,
+    AndRule,
+    OrRule,
+    NotRule,
+    _is_json,
+)
+
+
+# Type tests written as in the rules' `is_valid`; booleans are not numbers
+_STRING_TEST = "isinstance({value}, str)"
+_NUMBER_TEST = "type({value}) is not bool and isinstance({value}, (int, float))"
+
+
+def _emit_required(rule: RequiredRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a RequiredRule."""
+    return f"{rule.field!r} in data"
+
+
+def _emit_string_regex(rule: StringRegexRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a StringRegexRule."""
+    value = values[rule.field]
+    namespace[f"{name}_match"] = rule._match
+    return _STRING_TEST.format(value=value) + f" and {name}_match({value})"
+
+
+def _emit_email(rule: EmailRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for an EmailRule."""
+    value = values[rule.field]
+    namespace[f"{name}_is_email"] = rule._is_email
+    return _STRING_TEST.format(value=value) + f" and {name}_is_email({value})"
+
+
+def _emit_string_length(rule: StringLengthRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a StringLengthRule."""
+    value = values[rule.field]
+    condition = _STRING_TEST.format(value=value)
+    if rule.min_length is not None:
+        namespace[f"{name}_min"] = rule.min_length
+        condition += f" and len({value}) >= {name}_min"
+    if rule.max_length is not None:
+        namespace[f"{name}_max"] = rule.max_length
+        condition += f" and len({value}) <= {name}_max"
+    return condition
+
+
+def _emit_string_choices(rule: StringChoicesRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a StringChoicesRule."""
+    value = values[rule.field]
+    namespace[f"{name}_choices"] = rule._choice_set
+    return _STRING_TEST.format(value=value) + f" and {value} in {name}_choices"
+
+
+def _emit_number_range(rule: NumberRangeRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a NumberRangeRule.
+
+    The bounds are written as negated comparisons so that NaN passes them, as in `is_valid`.
+    """
+    value = values[rule.field]
+    condition = _NUMBER_TEST.format(value=value)
+    if rule.min_value is not None:
+        namespace[f"{name}_min"] = rule.min_value
+        condition += f" and not {value} < {name}_min"
+    if rule.max_value is not None:
+        namespace[f"{name}_max"] = rule.max_value
+        condition += f" and not {value} > {name}_max"
+    return condition
+
+
+def _emit_boolean(rule: BooleanRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a BooleanRule."""
+    return f"type({values[rule.field]}) is bool"
+
+
+def _emit_json(rule: JSONRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a JSONRule."""
+    value = values[rule.field]
+    namespace["_is_json"] = _is_json
+    return _STRING_TEST.format(value=value) + f" and _is_json({value})"
+
+
+def _emit_type(rule: TypeRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the condition for a TypeRule."""
+    namespace[f"{name}_type"] = rule.expected_type
+    return f"isinstance({values[rule.field]}, {name}_type)"
+
+
+def _emit_children(rule: t.Union[AllOf, AnyOf], name: str, namespace: t.Dict, values: t.Dict[str, str], operator: str) -> t.Optional[str]:
+    """Emits the conditions of a combinator's children joined by a boolean operator.
+
+    Returns None if any child cannot be inlined, so the combinator is called instead.
+    """
+    conditions = []
+    for index, child in enumerate(rule.children):
+        condition = _emit_condition(child, f"{name}_{index}", namespace, values)
+        if condition is None:
+            return None
+        conditions.append(f"({condition})")
+    return f" {operator} ".join(conditions)
+
+
+def _emit_all_of(rule: AllOf, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> t.Optional[str]:
+    """Emits the condition for an AllOf or AndRule."""
+    return _emit_children(rule, name, namespace, values, "and")
+
+
+def _emit_any_of(rule: AnyOf, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> t.Optional[str]:
+    """Emits the condition for an AnyOf or OrRule."""
+    return _emit_children(rule, name, namespace, values, "or")
+
+
+def _emit_not(rule: NotRule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> t.Optional[str]:
+    """Emits the condition for a NotRule."""
+    condition = _emit_condition(rule.rule, f"{name}_0", namespace, values)
+    return None if condition is None else f"not ({condition})"
+
+
+# Rules are matched on their exact class, so subclasses that override
+# `is_valid` are never inlined with their parent's logic.
+_EMITTERS: t.Dict[type, t.Callable[[t.Any, str, t.Dict, t.Dict[str, str]], t.Optional[str]]] = {
+    RequiredRule: _emit_required,
+    StringRegexRule: _emit_string_regex,
+    EmailRule: _emit_email,
+    StringLengthRule: _emit_string_length,
+    StringChoicesRule: _emit_string_choices,
+    NumberRangeRule: _emit_number_range,
+    BooleanRule: _emit_boolean,
+    JSONRule: _emit_json,
+    TypeRule: _emit_type,
+    AllOf: _emit_all_of,
+    AndRule: _emit_all_of,
+    AnyOf: _emit_any_of,
+    OrRule: _emit_any_of,
+    NotRule: _emit_not,
+}
+
+
+def _emit_condition(rule: Rule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> t.Optional[str]:
+    """Emits the condition under which a rule is valid.
+
+    Args:
+        rule (Rule): The rule to emit.
+        name (str): A unique prefix for the names the condition stores in `namespace`.
+        namespace (Dict): The globals of the generated function.
+        values (Dict[str, str]): The variable holding the value of each field.
+
+    Returns:
+        Optional[str]: A Python expression, or None if the rule cannot be inlined.
+    """
+    emitter = _EMITTERS.get(type(rule))
+    return None if emitter is None else emitter(rule, name, namespace, values)
+
+
+# For rules that report a type error or a rule-specific error, the type test
+# and the attribute holding the rule-specific message
+_TYPED_MESSAGES: t.Dict[type, t.Tuple[str, str]] = {
+    StringRegexRule: (_STRING_TEST, "_match_error"),
+    EmailRule: (_STRING_TEST, "_match_error"),
+    StringLengthRule: (_STRING_TEST, "_length_error"),
+    StringChoicesRule: (_STRING_TEST, "_choices_error"),
+    NumberRangeRule: (_NUMBER_TEST, "_range_error"),
+}
+
+# For rules that always report the same message, the attribute holding it
+_FIXED_MESSAGES: t.Dict[type, str] = {
+    RequiredRule: "_required_error",
+    BooleanRule: "_boolean_error",
+    JSONRule: "_json_error",
+    TypeRule: "_type_error",
+}
+
+
+def _emit_error(rule: Rule, name: str, namespace: t.Dict, values: t.Dict[str, str]) -> str:
+    """Emits the expression for the error message of a rule whose condition failed.
+
+    The messages of the built-in field rules are precomputed, so the right one
+    is chosen from the value already read instead of calling `error_message`,
+    which would read and type-check it again. Other rules, such as combinators,
+    still build their message through `error_message`.
+    """
+    if type(rule) in _FIXED_MESSAGES:
+        namespace[f"{name}_error"] = getattr(rule, _FIXED_MESSAGES[type(rule)])
+        return f"{name}_error"
+    if type(rule) in _TYPED_MESSAGES:
+        type_test, attribute = _TYPED_MESSAGES[type(rule)]
+        namespace[f"{name}_error"] = getattr(rule, attribute)
+        namespace[f"{name}_type_error"] = rule._type_error
+        return f"{name}_error if {type_test.format(value=values[rule.field])} else {name}_type_error"
+    return f"{name}.error_message(data, context)"
+
+
+def _fields(rule: Rule) -> t.List[str]:
+    """Returns the fields whose values a rule reads, including those of a combinator's children."""
+    if isinstance(rule, (AllOf, AnyOf)):
+        return [field for child in rule.children for field in _fields(child)]
+    if isinstance(rule, NotRule):
+        return _fields(rule.rule)
+    if type(rule) is RequiredRule:
+        return []  # Its condition tests the data, not the value
+    field = getattr(rule, "field", None)
+    return [] if field is None else [field]
+
+
+def _emit_check(rule: Rule, name: str, namespace: t.Dict, indent: str, values: t.Dict[str, str], any_error: bool = False) -> t.List[str]:
+    """Emits the lines that check a rule and record its error message.
+
+    The emitted code ends with an `if` statement whose body runs when the rule
+    fails. Built-in rules, and combinators of them, are inlined as a condition;
+    other rules are called through their own `check` method. Rules without a
+    field of their own read their fields into local variables first. With
+    `any_error`, the body returns True instead of recording a message, and
+    other rules are called through `is_valid`.
+    """
+    bindings = []
+    if getattr(rule, "field", None) is None:
+        values = {}
+        for field in _fields(rule):
+            if field not in values:
+                values[field] = f"{name}_value{len(values)}"
+                bindings.append(f"{indent}{values[field]} = data.get({field!r})")
+    condition = _emit_condition(rule, name, namespace, values)
+    if any_error:
+        if condition is None:
+            return [f"{indent}if not {name}.is_valid(data, context):", f"{indent}    return True"]
+        return bindings + [f"{indent}if not ({condition}):", f"{indent}    return True"]
+    if condition is None:
+        return [
+            f"{indent}error = {name}.check(data, context)",
+            f"{indent}if error is not None:",
+            f"{indent}    errors.append(error)",
+        ]
+    return bindings + [
+        f"{indent}if not ({condition}):",
+        f"{indent}    errors.append({_emit_error(rule, name, namespace, values)})",
+    ]
+
+
+def compile_validator(rules_by_field: t.Dict[t.Optional[str], t.List[Rule]], any_error: bool = False) -> t.Callable[[t.Dict, RuleContext], t.Any]:
+    """Generates a validation function specialised for a set of rules.
+
+    The checks of the built-in rules, including trees of AllOf, AnyOf and
+    NotRule combinators over them, are inlined into straight-line Python code,
+    avoiding a method call, a dictionary lookup and several attribute lookups per
+    rule. Error messages are still produced by the rules themselves, so the
+    generated function returns exactly what `DataContract.validate` would.
+
+    Args:
+        rules_by_field (Dict[Optional[str], List[Rule]]): The rules to apply, grouped
+            by field with RequiredRules first, as built by `DataContract`.
+        any_error (bool, optional): Generate a function that returns True as soon as
+            a rule fails, and False if none does, without building error messages.
+            Defaults to False.
+
+    Returns:
+        Callable[[t.Dict, RuleContext], Any]: A function taking the data and an
+            optional context and returning a list of error messages, or with
+            `any_error`, whether any rule failed.
+    """
+    namespace: t.Dict[str, t.Any] = {}
+    lines = ["def _validate(data, context=None):"]
+    if not any_error:
+        lines.append("    errors = []")
+    rule_index = 0
+    for field, field_rules in rules_by_field.items():
+        indent = "    "
+        if field is not None:
+            lines.append(f"{indent}value = data.get({field!r})")
+        for rule in field_rules:
+            name = f"_rule{rule_index}"
+            rule_index += 1
+            namespace[name] = rule
+            lines.extend(_emit_check(rule, name, namespace, indent, {field: "value"}, any_error))
+            if isinstance(rule, RequiredRule):
+                # The field's remaining rules only run when it is present
+                lines.append(f"{indent}else:")
+                indent += "    "
+                lines.append(f"{indent}pass")
+    lines.append("    return False" if any_error else "    return errors")
+    source = "\n".join(lines)
+    exec(compile(source, "<pyveritas.codegen>", "exec"), namespace)
+    return namespace["_validate"]
+
+
+@functools.lru_cache(maxsize=None)
+def _jit_range_kernel() -> t.Callable:
+    """Compiles the range-checking kernel with Numba on first use.
+
+    Numba is imported here rather than at module level because importing it is
+    slow. The explicit signature makes Numba compile eagerly, and `cache=True`
+    stores the machine code on disk so later processes skip compilation.
+
+    Returns:
+        Callable: A function taking a (rules, rows) float64 array of values and
+            per-rule minimum and maximum arrays, and returning a boolean array of
+            the same shape. NaN passes both bounds, as in `NumberRangeRule.is_valid`.
+    """
+    import numba
+    np = _numpy()
+
+    @numba.njit("boolean[:, :](float64[:, :], float64[:], float64[:])", parallel=True, cache=True)
+    def kernel(values, mins, maxs):
+        rule_count, row_count = values.shape
+        valid = np.empty((rule_count, row_count), dtype=np.bool_)
+        for row in numba.prange(row_count):
+            for rule in range(rule_count):
+                value = values[rule, row]
+                valid[rule, row] = not (value < mins[rule]) and not (value > maxs[rule])
+        return valid
+
+    return kernel
+
+
+# Integers beyond this magnitude may change value when converted to float64
+_FLOAT64_EXACT_INTEGER = 2 ** 53
+
+
+def _exact_in_float64(bound: t.Union[int, float, None]) -> bool:
+    """Checks whether a bound is kept exactly when the kernel converts it to float64."""
+    try:
+        return bound is None or float(bound) == bound
+    except OverflowError:
+        return False
+
+
+def compile_range_kernel(rules: t.List[Rule]) -> t.Callable[[t.Dict[str, t.Sequence]], t.Dict[Rule, "np.ndarray"]]:
+    """Builds a Numba-compiled checker for the numeric and length rules in a list.
+
+    The bounds of every NumberRangeRule and StringLengthRule are packed into
+    NumPy arrays once, so a batch of columns can be checked against all of
+    them in a single parallel native loop. The kernel compares in float64, so
+    rules whose bounds float64 cannot represent exactly, and integer columns
+    with values beyond 2**53, are left to the exact checks. Other rules are
+    ignored and must be evaluated separately.
+
+    Args:
+        rules (List[Rule]): The rules to compile.
+
+    Returns:
+        Callable[[Dict[str, Sequence]], Dict[Rule, np.ndarray]]: A function taking
+            columns keyed by field name and returning a boolean validity array for
+            each compiled rule whose column is present with a suitable dtype.
+
+    Raises:
+        ImportError: If NumPy or Numba is not installed.
+    """
+    if not _HAS_NUMPY:
+        raise ImportError("compile_range_kernel requires NumPy")
+    np = _numpy()
+    kernel = _jit_range_kernel()
+    bounded_rules = []
+    for rule in rules:
+        if type(rule) is NumberRangeRule:
+            if _exact_in_float64(rule.min_value) and _exact_in_float64(rule.max_value):
+                bounded_rules.append((rule, rule.min_value, rule.max_value, "iuf"))
+        elif type(rule) is StringLengthRule:
+            bounded_rules.append((rule, rule.min_length, rule.max_length, "U"))
+    mins = np.array([-np.inf if low is None else low for _, low, _, _ in bounded_rules], dtype=np.float64)
+    maxs = np.array([np.inf if high is None else high for _, _, high, _ in bounded_rules], dtype=np.float64)
+
+    def check(columns: t.Dict[str, t.Sequence]) -> t.Dict[Rule, "np.ndarray"]:
+        selected, rows = [], []
+        for index, (rule, _, _, kinds) in enumerate(bounded_rules):
+            if rule.field not in columns:
+                continue
+            values = _as_column(columns[rule.field])
+            if values.dtype.kind not in kinds:
+                continue
+            if values.dtype.kind in "iu" and values.size and (
+                values.max() > _FLOAT64_EXACT_INTEGER or values.min() < -_FLOAT64_EXACT_INTEGER
+            ):
+                continue
+            selected.append(index)
+            rows.append(np.char.str_len(values) if kinds == "U" else values)
+        if not selected:
+            return {}
+        valid = kernel(np.vstack(rows).astype(np.float64), mins[selected], maxs[selected])
+        return {bounded_rules[index][0]: valid[row] for row, index in enumerate(selected)}
+
+    return check
@@ -1,16 +1,55 @@
-from abc import ABC, abstractmethod
 import typing as t
-from pyveritas.rules import Rule, RuleContext, StringRegexRule, NumberRangeRule, StringLengthRule, RequiredRule
+from pyveritas.rules import Rule, RuleContext, StringRegexRule, NumberRangeRule, StringLengthRule, RequiredRule, EmailRule
+from pyveritas.codegen import compile_validator, compile_range_kernel
 
 
-class DataContract(ABC):
+class _RuleList(list):
+    """A contract's list of rules, which recompiles the contract when it is modified.
+
+    Rules appended to or removed from `DataContract.rules` directly take effect
+    at once, without validation having to check for changes on every call.
+    """
+
+    def __init__(self, rules: t.Iterable[Rule], on_change: t.Callable[[], None]):
+        super().__init__(rules)
+        self._on_change = on_change
+
+
+def _recompiling(name: str) -> t.Callable:
+    """Wraps a mutating `list` method so that it notifies the list's contract."""
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        result = method(self, *args)
+        self._on_change()
+        return result
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_RuleList, _name, _recompiling(_name))
+
+
+class DataContract:
     """
     Base class for all data contracts.
 
     A data contract defines the structure and constraints for a particular
-    type of data. Subclasses must implement the `validate` method.
+    type of data. Subclasses provide the contract's rules and may override
+    the `validate` method to customise how they are applied.
     """
 
+    # Defaults for subclasses that do not call `DataContract.__init__`
+    _rules: t.Optional[t.List[Rule]] = None
+    _range_kernel = None
+    _compile_count = 0
+
     def __init__(self, rules: t.List[Rule] = None):
         """Initializes a new DataContract.
 
@@ -20,10 +59,56 @@ class DataContract(ABC):
         """
         self.rules = rules or []
 
-    @abstractmethod
+    @property
+    def rules(self) -> t.Optional[t.List[Rule]]:
+        """List[Rule]: The contract's rules.
+
+        Modifying the list, or assigning a new one, recompiles the contract.
+        """
+        return self._rules
+
+    @rules.setter
+    def rules(self, rules: t.List[Rule]):
+        self._rules = _RuleList(rules, self._recompile)
+        self._recompile()
+
+    def __getattr__(self, name: str) -> t.Any:
+        """Compiles contracts whose subclass does not call `DataContract.__init__`.
+
+        Python only calls this for attributes that are not set, so compiled
+        contracts do not pay for it.
+        """
+        if name in ("_rules_by_field", "_checks", "_compiled", "_compiled_any_error"):
+            self.compile()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _group_rules(self):
+        """Groups the contract's rules by the field they validate.
+
+        Within each group, RequiredRules come first so that the remaining rules
+        for a missing field can be skipped. Rules that do not target a single
+        field are grouped under None. The rules' bound `check` methods are
+        collected in the same order for `validate`.
+        """
+        rules_by_field: t.Dict[t.Optional[str], t.List[Rule]] = {}
+        for rule in self.rules or ():
+            rules_by_field.setdefault(getattr(rule, "field", None), []).append(rule)
+        for field_rules in rules_by_field.values():
+            field_rules.sort(key=lambda rule: not isinstance(rule, RequiredRule))
+        self._rules_by_field = rules_by_field
+        # Bound `check` methods, so `validate` does no attribute lookups per rule
+        self._checks = tuple(
+            tuple((rule.check, isinstance(rule, RequiredRule)) for rule in field_rules)
+            for field_rules in rules_by_field.values()
+        )
+
     def validate(self, data: t.Dict, context: RuleContext = None) -> t.List[str]:
         """Validates the given data against the contract's rules.
 
+        If a field fails its RequiredRule, the other rules for that field are
+        skipped, so a missing field is reported once.
+
         Args:
             data (t.Dict): A dictionary containing the data to validate.
             context (RuleContext, optional): A RuleContext object providing additional
@@ -32,7 +117,34 @@ class DataContract(ABC):
         Returns:
             t.List[str]: A list of error messages. If the list is empty, the data is valid.
         """
-        pass
+        errors = []
+        for field_checks in self._checks:
+            for check, required in field_checks:
+                error = check(data, context)
+                if error is not None:
+                    errors.append(error)
+                    if required:
+                        break
+        return errors
+
+    def has_any_error(self, data: t.Dict, context: RuleContext = None) -> bool:
+        """Checks whether the data breaks any of the contract's rules.
+
+        Unlike `validate`, this stops at the first failing rule and builds no
+        error messages, so it is cheaper when only validity matters. Contracts
+        that override `validate` are checked through it.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): A RuleContext object providing additional
+                context for the validation. Defaults to None.
+
+        Returns:
+            bool: True if at least one rule fails, False if the data is valid.
+        """
+        if self._compiled_any_error is None:
+            return bool(self.validate(data, context))
+        return self._compiled_any_error(data, context)
 
     def add_rule(self, rule: Rule):
         """Adds a rule to the contract.
@@ -42,6 +154,54 @@ class DataContract(ABC):
         """
         self.rules.append(rule)
 
+    def compile(self) -> t.Callable[[t.Dict, RuleContext], t.List[str]]:
+        """Generates a validation function specialised for the contract's rules.
+
+        The rules are grouped by field, and the generated function inlines the
+        checks of the built-in rules and is used when the contract is called; a
+        second one, which stops at the first failure, backs `has_any_error`.
+        They are rebuilt whenever `rules` changes. Contracts that override
+        `validate` keep using their own implementation.
+
+        Returns:
+            Callable[[t.Dict, RuleContext], t.List[str]]: The function used by `__call__`.
+        """
+        self._group_rules()
+        self._compile_count += 1  # Lets validators notice that the rules have changed
+        if type(self).validate is DataContract.validate:
+            self._compiled = compile_validator(self._rules_by_field)
+            self._compiled_any_error = compile_validator(self._rules_by_field, any_error=True)
+        else:
+            self._compiled = self.validate
+            self._compiled_any_error = None
+        return self._compiled
+
+    def _recompile(self):
+        """Compiles the contract again after `rules` has changed, including its Numba kernel if it has one."""
+        self.compile()
+        if self._range_kernel is not None:
+            self.compile_numba()
+
+    def compile_numba(self) -> t.Callable[[t.Dict[str, t.Sequence]], t.Dict[Rule, t.Any]]:
+        """Compiles the contract's numeric range and string length rules with Numba.
+
+        The rules' bounds are packed into NumPy arrays and checked by a parallel
+        native kernel that is compiled ahead of time for a fixed signature and
+        cached on disk, so repeated use (including in later processes) does not
+        recompile. Once compiled, `Validator.validate_batch` uses the kernel for
+        these rules; all other rules keep their regular evaluation.
+
+        Returns:
+            Callable[[Dict[str, Sequence]], Dict[Rule, np.ndarray]]: A function taking
+                columns keyed by field name and returning a boolean validity array
+                for each compiled rule.
+
+        Raises:
+            ImportError: If NumPy or Numba is not installed.
+        """
+        self._range_kernel = compile_range_kernel(self.rules)
+        return self._range_kernel
+
     def __call__(self, data: t.Dict, context: RuleContext = None) -> t.List[str]:
         """Allows the contract to be called like a function.
 
@@ -53,7 +213,7 @@ class DataContract(ABC):
         Returns:
             t.List[str]: A list of error messages. If the list is empty, the data is valid.
         """
-        return self.validate(data, context)
+        return self._compiled(data, context)
 
 
 class UserContract(DataContract):
@@ -69,29 +229,9 @@ class UserContract(DataContract):
         """Initializes a new UserContract with the validation rules."""
         super().__init__([
             RequiredRule("email"),
-            StringRegexRule(
-                field="email",
-                regex=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-            ),
+            EmailRule("email"),
             RequiredRule("age"),
             NumberRangeRule(field="age", min_value=0, max_value=120),
             RequiredRule("name"),
             StringLengthRule(field="name", min_length=3, max_length=20)
         ])
-
-    def validate(self, data: t.Dict, context: RuleContext = None) -> t.List[str]:
-        """Validates the given data against the contract's rules.
-
-        Args:
-            data (t.Dict): A dictionary containing the data to validate.
-            context (RuleContext, optional): A RuleContext object providing additional
-                context for the validation. Defaults to None.
-
-        Returns:
-            t.List[str]: A list of error messages. If the list is empty, the data is valid.
-        """
-        errors = []
-        for rule in self.rules:
-            if not rule.is_valid(data, context):
-                errors.append(rule.error_message(data, context))
-        return errors
\ No newline at end of file
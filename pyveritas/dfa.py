@@ -0,0 +1,474 @@
+import threading
+import typing as t
+
+
+class UnsupportedPattern(ValueError):
+    """Raised when a regular expression uses syntax that the DFA engine cannot represent."""
+
+
+# Predicates for the escapes that match a category of characters, mirroring
+# how Python's `re` classifies Unicode strings.
+_CATEGORIES: t.Dict[str, t.Callable[[str], bool]] = {
+    "d": str.isdecimal,
+    "w": lambda char: char.isalnum() or char == "_",
+    "s": str.isspace,
+}
+
+_CHARACTER_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "f": "\f", "v": "\v", "a": "\a"}
+
+# Upper bound on the NFA states built for one pattern, so that large counted
+# repetitions such as `a{1000}` fall back to `re` instead of exploding.
+_MAX_NFA_STATES = 2000
+
+# Upper bound on the characters cached per DFA state.
+_MAX_CACHED_CHARACTERS = 4096
+
+# Upper bound on the DFA states cached for one pattern. When it is reached
+# the cache is discarded and rebuilt from the start state, as RE2 does, so
+# memory stays bounded and each character still costs at most one NFA step.
+_MAX_DFA_STATES = 10000
+
+
+class _CharSet:
+    """A set of characters, described by ranges and categories, possibly negated."""
+
+    __slots__ = ("ranges", "categories", "negated")
+
+    def __init__(self, ranges=(), categories=(), negated=False):
+        self.ranges = tuple(ranges)
+        self.categories = tuple(categories)
+        self.negated = negated
+
+    def __contains__(self, char: str) -> bool:
+        code = ord(char)
+        found = any(low <= code <= high for low, high in self.ranges) or any(
+            (not predicate(char)) if inverted else predicate(char) for predicate, inverted in self.categories
+        )
+        return found != self.negated
+
+
+def _literal(char: str) -> _CharSet:
+    return _CharSet(ranges=[(ord(char), ord(char))])
+
+
+class _Parser:
+    """Parses the subset of `re` syntax that has an equivalent DFA into a small syntax tree.
+
+    Nodes are tuples: ("set", _CharSet), ("concat", [nodes]), ("alt", [nodes])
+    and ("repeat", node, min, max), where max is None for unbounded repetition.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.position = 0
+
+    def parse(self):
+        node = self._alternation()
+        if self.position != len(self.pattern):
+            raise UnsupportedPattern(f"Unbalanced parenthesis at position {self.position}")
+        return node
+
+    def _peek(self) -> t.Optional[str]:
+        return self.pattern[self.position] if self.position < len(self.pattern) else None
+
+    def _next(self) -> str:
+        if self.position >= len(self.pattern):
+            raise UnsupportedPattern("Unexpected end of pattern")
+        char = self.pattern[self.position]
+        self.position += 1
+        return char
+
+    def _alternation(self):
+        branches = [self._concatenation()]
+        while self._peek() == "|":
+            self.position += 1
+            branches.append(self._concatenation())
+        return branches[0] if len(branches) == 1 else ("alt", branches)
+
+    def _concatenation(self):
+        items = []
+        while self._peek() not in (None, "|", ")"):
+            items.append(self._repetition())
+        return ("concat", items)
+
+    def _repetition(self):
+        node = self._atom()
+        while True:
+            char = self._peek()
+            if char in ("*", "+", "?"):
+                self.position += 1
+                bounds = {"*": (0, None), "+": (1, None), "?": (0, 1)}[char]
+            elif char == "{":
+                bounds = self._counted_repetition()
+                if bounds is None:
+                    return node
+            else:
+                return node
+            if self._peek() == "?":
+                self.position += 1  # Laziness does not change whether a match exists
+            elif self._peek() == "+":
+                raise UnsupportedPattern("Possessive quantifiers are not supported")
+            if node[0] == "repeat":
+                raise UnsupportedPattern("Multiple repeat")
+            node = ("repeat", node, bounds[0], bounds[1])
+
+    def _counted_repetition(self) -> t.Optional[t.Tuple[int, t.Optional[int]]]:
+        end = self.pattern.find("}", self.position)
+        if end < 0:
+            return None
+        low, comma, high = self.pattern[self.position + 1:end].partition(",")
+        if not all(part == "" or (part.isascii() and part.isdigit()) for part in (low, high)) or not (low or comma):
+            return None  # Not a quantifier, so `re` treats the brace as a literal
+        self.position = end + 1
+        minimum = int(low) if low else 0
+        maximum = (int(high) if high else None) if comma else minimum
+        if maximum is not None and maximum < minimum:
+            raise UnsupportedPattern("Minimum repeat greater than maximum")
+        return minimum, maximum
+
+    def _atom(self):
+        char = self._next()
+        if char == "(":
+            if self.pattern.startswith("?:", self.position):
+                self.position += 2
+            elif self._peek() == "?":
+                raise UnsupportedPattern("Group extensions other than (?:...) are not supported")
+            node = self._alternation()
+            if self._next() != ")":
+                raise UnsupportedPattern("Missing )")
+            return node
+        if char == "[":
+            return ("set", self._character_class())
+        if char == ".":
+            return ("set", _CharSet(ranges=[(ord("\n"), ord("\n"))], negated=True))
+        if char == "\\":
+            return ("set", self._escape())
+        if char in "^$":
+            raise UnsupportedPattern("Anchors are only supported at the ends of the pattern")
+        if char in "*+?":
+            raise UnsupportedPattern("Nothing to repeat")
+        return ("set", _literal(char))
+
+    def _escape(self) -> _CharSet:
+        char = self._next()
+        if char.lower() in _CATEGORIES:
+            return _CharSet(categories=[(_CATEGORIES[char.lower()], char.isupper())])
+        if char in _CHARACTER_ESCAPES:
+            return _literal(_CHARACTER_ESCAPES[char])
+        if char in "xuU":
+            digits = {"x": 2, "u": 4, "U": 8}[char]
+            code = self.pattern[self.position:self.position + digits]
+            if len(code) != digits or not all(c in "0123456789abcdefABCDEF" for c in code):
+                raise UnsupportedPattern(f"Incomplete escape \\{char}")
+            self.position += digits
+            return _literal(chr(int(code, 16)))
+        if char.isascii() and char.isalnum():
+            # Backreferences, \b, \A, \Z and octal escapes
+            raise UnsupportedPattern(f"Escape \\{char} is not supported")
+        return _literal(char)
+
+    def _character_class(self) -> _CharSet:
+        negated = self._peek() == "^"
+        if negated:
+            self.position += 1
+        ranges, categories = [], []
+        first = True
+        while True:
+            char = self._next()
+            if char == "]" and not first:
+                break
+            first = False
+            if char == "\\":
+                item = self._escape()
+                if item.categories:
+                    categories.extend(item.categories)
+                    continue
+                low = item.ranges[0][0]
+            else:
+                low = ord(char)
+            if self._peek() == "-" and self.pattern[self.position + 1:self.position + 2] not in ("]", ""):
+                self.position += 1
+                end_char = self._next()
+                if end_char == "\\":
+                    item = self._escape()
+                    if item.categories:
+                        raise UnsupportedPattern("Bad character range")
+                    high = item.ranges[0][0]
+                else:
+                    high = ord(end_char)
+                if high < low:
+                    raise UnsupportedPattern("Bad character range")
+                ranges.append((low, high))
+            else:
+                ranges.append((low, low))
+        return _CharSet(ranges, categories, negated)
+
+
+class _NFA:
+    """A Thompson NFA whose labelled transitions refer to character sets by index."""
+
+    def __init__(self):
+        self.epsilon: t.List[t.List[int]] = []
+        self.labelled: t.List[t.List[t.Tuple[int, int]]] = []
+        self.charsets: t.List[_CharSet] = []
+        self._charset_indices: t.Dict[int, int] = {}  # By id, so the copies made by a quantifier share one index
+
+    def state(self) -> int:
+        if len(self.epsilon) >= _MAX_NFA_STATES:
+            raise UnsupportedPattern("Pattern is too large")
+        self.epsilon.append([])
+        self.labelled.append([])
+        return len(self.epsilon) - 1
+
+    def build(self, node) -> t.Tuple[int, int]:
+        """Builds the fragment for a syntax tree node, returning its start and end states."""
+        kind = node[0]
+        if kind == "set":
+            start, end = self.state(), self.state()
+            charset = node[1]
+            index = self._charset_indices.get(id(charset))
+            if index is None:
+                index = self._charset_indices[id(charset)] = len(self.charsets)
+                self.charsets.append(charset)
+            self.labelled[start].append((index, end))
+            return start, end
+        if kind == "concat":
+            start = end = self.state()
+            for item in node[1]:
+                item_start, item_end = self.build(item)
+                self.epsilon[end].append(item_start)
+                end = item_end
+            return start, end
+        if kind == "alt":
+            start, end = self.state(), self.state()
+            for branch in node[1]:
+                branch_start, branch_end = self.build(branch)
+                self.epsilon[start].append(branch_start)
+                self.epsilon[branch_end].append(end)
+            return start, end
+        _, item, minimum, maximum = node
+        start = end = self.state()
+        for _ in range(minimum):
+            item_start, item_end = self.build(item)
+            self.epsilon[end].append(item_start)
+            end = item_end
+        if maximum is None:
+            item_start, item_end = self.build(item)
+            self.epsilon[end].append(item_start)
+            self.epsilon[item_end].append(item_start)
+            loop_end = self.state()
+            self.epsilon[item_end].append(loop_end)
+            self.epsilon[end].append(loop_end)
+            return start, loop_end
+        for _ in range(maximum - minimum):
+            item_start, item_end = self.build(item)
+            optional_end = self.state()
+            self.epsilon[end].append(item_start)
+            self.epsilon[end].append(optional_end)
+            self.epsilon[item_end].append(optional_end)
+            end = optional_end
+        return start, end
+
+    def closure(self, states: t.Iterable[int]) -> t.FrozenSet[int]:
+        seen = set(states)
+        stack = list(seen)
+        while stack:
+            for target in self.epsilon[stack.pop()]:
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return frozenset(seen)
+
+
+class _DFACache:
+    """The DFA states built so far for a pattern, with their transitions.
+
+    State ids index the lists; ids 0 and 1 are the dead and accept states.
+    A cache is replaced as a whole when full, so a match in progress keeps
+    using the cache its state ids belong to.
+    """
+
+    __slots__ = ("state_ids", "states", "accepting", "transitions", "start")
+
+    def __init__(self):
+        self.state_ids: t.Dict[t.FrozenSet[int], int] = {}
+        self.states: t.List[t.Optional[t.FrozenSet[int]]] = [frozenset(), None]
+        self.accepting: t.List[bool] = [False, True]
+        self.transitions: t.List[t.Dict[str, int]] = [{}, {}]
+        self.start = 0
+
+
+class DFAPattern:
+    """A regular expression compiled to a deterministic finite automaton.
+
+    The automaton is built lazily, as in RE2: a DFA state is the set of NFA
+    states the input could have reached, and each transition is computed the
+    first time a character is seen in that state and cached. Matching does
+    constant work per character, so its running time is linear in the length
+    of the string regardless of the pattern. The number of cached states is
+    bounded, and patterns may be shared between threads.
+
+    Only the part of `re` syntax with a DFA equivalent is supported: literals,
+    escapes, character classes, `.`, `|`, groups, the `*`, `+`, `?` and
+    `{m,n}` quantifiers, and `^`/`$` at the ends of the pattern. Matching
+    follows `re.match`: the pattern is anchored at the start of the string,
+    and `$` also accepts a single trailing newline.
+    """
+
+    _DEAD = 0
+    _ACCEPT = 1  # Absorbing state for unanchored patterns once a match is found
+
+    def __init__(self, pattern: str):
+        """Compiles a regular expression.
+
+        Args:
+            pattern (str): The regular expression to compile.
+
+        Raises:
+            UnsupportedPattern: If the pattern uses syntax that has no DFA equivalent.
+        """
+        self.pattern = pattern
+        body = pattern[1:] if pattern.startswith("^") else pattern
+        trailing_backslashes = len(body[:-1]) - len(body[:-1].rstrip("\\"))
+        self._anchored_end = body.endswith("$") and trailing_backslashes % 2 == 0
+        if self._anchored_end:
+            body = body[:-1]
+        tree = _Parser(body).parse()
+        if self._anchored_end and tree[0] == "alt":
+            raise UnsupportedPattern("A trailing $ after an alternation anchors only its last branch")
+        nfa = _NFA()
+        start, self._nfa_accept = nfa.build(tree)
+        self._nfa = nfa
+        # Per NFA state and per character memos for `_step`; both are bounded, by the NFA's size and
+        # by `_MAX_CACHED_CHARACTERS`, and hold values that threads may compute concurrently
+        self._closures: t.Dict[int, t.FrozenSet[int]] = {}
+        self._charsets_by_char: t.Dict[str, t.FrozenSet[int]] = {}
+        self._start_states = self._closure(start)
+        self._lock = threading.Lock()  # Serializes state creation between threads sharing the pattern
+        self._cache = self._new_cache()
+
+    def _closure(self, nfa_state: int) -> t.FrozenSet[int]:
+        """Returns the NFA states reachable through epsilon moves that read a character or accept.
+
+        The other states reached do not affect later transitions or acceptance,
+        so leaving them out keeps DFA states small without changing the matches.
+        """
+        closure = self._closures.get(nfa_state)
+        if closure is None:
+            nfa = self._nfa
+            closure = frozenset(
+                state for state in nfa.closure([nfa_state]) if nfa.labelled[state] or state == self._nfa_accept
+            )
+            self._closures[nfa_state] = closure
+        return closure
+
+    def _charsets_containing(self, char: str) -> t.FrozenSet[int]:
+        """Returns the indices of the NFA's character sets that contain a character."""
+        charsets = self._charsets_by_char.get(char)
+        if charsets is None:
+            charsets = frozenset(index for index, charset in enumerate(self._nfa.charsets) if char in charset)
+            if len(self._charsets_by_char) < _MAX_CACHED_CHARACTERS:
+                self._charsets_by_char[char] = charsets
+        return charsets
+
+    def _new_cache(self) -> _DFACache:
+        """Creates an empty state cache holding only the dead, accept and start states."""
+        cache = _DFACache()
+        cache.start = self._state_id(cache, self._start_states)
+        return cache
+
+    def _state_id(self, cache: _DFACache, states: t.FrozenSet[int]) -> t.Optional[int]:
+        """Returns the DFA state for a set of NFA states, creating it in the cache if needed.
+
+        Returns None if the state is new and the cache is full.
+        """
+        accepting = self._nfa_accept in states
+        if accepting and not self._anchored_end:
+            return self._ACCEPT
+        if not states:
+            return self._DEAD
+        state = cache.state_ids.get(states)
+        if state is None:
+            if len(cache.states) >= _MAX_DFA_STATES:
+                return None
+            state = len(cache.states)
+            cache.state_ids[states] = state
+            cache.states.append(states)
+            cache.accepting.append(accepting)
+            cache.transitions.append({})
+        return state
+
+    def _step(self, cache: _DFACache, state: int, char: str) -> t.Tuple[_DFACache, int]:
+        """Computes and caches the transition from a DFA state on a character.
+
+        If the cache is full, matching continues in a fresh cache, which is
+        returned along with the next state.
+        """
+        labelled = self._nfa.labelled
+        charsets = self._charsets_containing(char)
+        targets = [
+            target
+            for nfa_state in cache.states[state]
+            for charset, target in labelled[nfa_state]
+            if charset in charsets
+        ]
+        next_states = frozenset().union(*map(self._closure, targets))
+        with self._lock:
+            next_state = self._state_id(cache, next_states)
+            if next_state is not None:
+                transitions = cache.transitions[state]
+                if len(transitions) < _MAX_CACHED_CHARACTERS:
+                    transitions[char] = next_state
+                return cache, next_state
+            while next_state is None:
+                if self._cache is cache:  # Otherwise another thread has already replaced it
+                    self._cache = self._new_cache()
+                cache = self._cache
+                next_state = self._state_id(cache, next_states)
+        return cache, next_state
+
+    def _run(self, value: str) -> bool:
+        """Runs the automaton over a string, returning whether it ends in an accepting state."""
+        cache = self._cache
+        transitions = cache.transitions
+        state = cache.start
+        for char in value:
+            next_state = transitions[state].get(char)
+            if next_state is None:
+                cache, next_state = self._step(cache, state, char)
+                transitions = cache.transitions
+            state = next_state
+            if state <= self._ACCEPT:
+                break  # Dead, or (for unanchored patterns) already matched
+        return cache.accepting[state]
+
+    def match(self, value: str) -> bool:
+        """Checks whether the pattern matches at the start of a string.
+
+        Args:
+            value (str): The string to match.
+
+        Returns:
+            bool: True if the string matches, as `re.match` would find.
+        """
+        if self._cache.start == self._ACCEPT:
+            return True
+        if self._run(value):
+            return True
+        # Like `re`, a trailing `$` also matches before a final newline
+        return self._anchored_end and value.endswith("\n") and self._run(value[:-1])
+
+
+def compile_dfa(pattern: str) -> DFAPattern:
+    """Compiles a regular expression to a lazily built DFA.
+
+    Args:
+        pattern (str): The regular expression to compile.
+
+    Returns:
+        DFAPattern: The compiled pattern, exposing a `match` method.
+
+    Raises:
+        UnsupportedPattern: If the pattern uses syntax that has no DFA equivalent.
+    """
+    return DFAPattern(pattern)
@@ -1,8 +1,429 @@
 import re  # For regular expression validation
 from datetime import datetime  # For date validation
 import typing as t
-from abc import ABC, abstractmethod
+import functools
+import collections
+import importlib.util
 import json
+import string
+import sys
+import threading
+import types
+from pyveritas.dfa import compile_dfa, UnsupportedPattern
+
+try:
+    import re2  # Optional linear-time regular expression engine (google-re2)
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False  # Unsupported patterns fall back to `re` silently
+except ImportError:
+    re2 = None
+
+try:
+    import pcre2  # Optional PCRE2 bindings, which JIT-compile patterns to machine code
+except ImportError:
+    pcre2 = None
+
+
+_HAS_NUMPY = importlib.util.find_spec("numpy") is not None  # Optional, used for column-wise batch validation
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy() -> types.ModuleType:
+    """Imports NumPy on first use.
+
+    NumPy is only needed for column-wise batch validation, so it is not
+    imported with the package. Callers check `_HAS_NUMPY` first.
+
+    Returns:
+        ModuleType: The `numpy` module.
+    """
+    import numpy
+    return numpy
+
+try:
+    import hyperscan  # Optional multi-pattern regular expression engine
+except ImportError:
+    hyperscan = None
+
+try:
+    import orjson  # Optional, a faster JSON parser used by JSONRule
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_regex(regex: str, engine: str = "re"):
+    """Compiles a regular expression with the given engine.
+
+    The default, Python's `re`, has the lowest per-call overhead and is the
+    fastest choice for the short strings typical of record fields. "re2"
+    matches in linear time with no risk of catastrophic backtracking, which
+    matters for untrusted patterns or input, but its binding costs far more
+    per call. "pcre2" JIT-compiles the pattern to machine code and is the
+    fastest on long strings. "dfa" also matches in linear time, using the
+    pure-Python automaton from `pyveritas.dfa`; it needs no extra package
+    and has far less per-call overhead than re2, but is slower than `re`.
+    Patterns that the selected engine rejects (such as backreferences under
+    re2 or the DFA) are compiled with `re` instead. Compiled patterns are
+    cached, so rules with the same regular expression and engine share one
+    pattern object, and for the DFA the states it has already built.
+
+    Args:
+        regex (str): The regular expression to compile.
+        engine (str, optional): One of "re", "re2", "pcre2" or "dfa". Defaults to "re".
+
+    Returns:
+        A compiled pattern object exposing a `match` method.
+
+    Raises:
+        ValueError: If the engine is not recognised.
+        ImportError: If the engine's package is not installed.
+    """
+    if engine == "re":
+        return re.compile(regex)
+    if engine == "re2":
+        if re2 is None:
+            raise ImportError("The re2 regular expression engine requires google-re2")
+        try:
+            return re2.compile(regex, _RE2_OPTIONS)
+        except re2.error:
+            return re.compile(regex)
+    if engine == "pcre2":
+        if pcre2 is None:
+            raise ImportError("The pcre2 regular expression engine requires pcre2")
+        try:
+            return pcre2.compile(regex)
+        except pcre2.error:
+            return re.compile(regex)
+    if engine == "dfa":
+        pattern = re.compile(regex)  # Reports invalid patterns exactly as `re` does
+        try:
+            return compile_dfa(regex)
+        except UnsupportedPattern:
+            return pattern
+    raise ValueError(f"Unknown regular expression engine: {engine!r}")
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+def _literal_matcher(regex: str) -> t.Optional[t.Callable[[str], t.Any]]:
+    """Returns a string operation equivalent to `re.match(regex, value)` for literal patterns.
+
+    `re.match` anchors at the start of the string, so a pattern without
+    metacharacters (other than a leading `^` and a trailing `$`) is a prefix
+    test, or an equality test when it ends with `$`. Like `re`, `$` also
+    accepts a single trailing newline.
+
+    Args:
+        regex (str): The regular expression to analyze.
+
+    Returns:
+        Optional[Callable[[str], Any]]: A function whose result is truthy when the
+            string matches, or None if the pattern is not a plain literal.
+    """
+    literal = regex[1:] if regex.startswith("^") else regex
+    anchored = literal.endswith("$")
+    if anchored:
+        literal = literal[:-1]
+    if _REGEX_METACHARACTERS.intersection(literal):
+        return None
+    if anchored:
+        return frozenset((literal, literal + "\n")).__contains__
+    return lambda value: value.startswith(literal)
+
+# `^\d+$`, `[0-9]{5}$` and similar: one digit class, one quantifier, anchored at the end
+_DIGITS_REGEX = re.compile(r"\^?(\\d|\[0-9\])(?:(\+)|(\*)|\{(\d+)\}|\{(\d+),(\d*)\})\$")
+
+def _digits_matcher(regex: str) -> t.Optional[t.Callable[[str], bool]]:
+    """Returns a string test equivalent to `re.match(regex, value)` for digit-run patterns.
+
+    Recognizes a single `\\d` or `[0-9]` with a `+`, `*`, `{n}` or `{m,n}`
+    quantifier, anchored at the end. In a `str` pattern `\\d` matches exactly
+    the characters for which `str.isdecimal` is true, while `[0-9]` also
+    requires ASCII. Like `re`, `$` also accepts a single trailing newline.
+
+    Args:
+        regex (str): The regular expression to analyze.
+
+    Returns:
+        Optional[Callable[[str], bool]]: A function returning True when the string
+            matches, or None if the pattern is not a digit run.
+    """
+    shape = _DIGITS_REGEX.fullmatch(regex)
+    if shape is None:
+        return None
+    digit_class, plus, star, exact, minimum, maximum = shape.groups()
+    if plus or star:
+        minimum, maximum = (1 if plus else 0), None
+    elif exact is not None:
+        minimum = maximum = int(exact)
+    else:
+        minimum, maximum = int(minimum), (int(maximum) if maximum else None)
+        if maximum is not None and maximum < minimum:
+            return None  # `re` rejects the pattern; let it report the error
+    if digit_class == "[0-9]":
+        def is_digits(value: str) -> bool:
+            return value.isascii() and value.isdecimal()
+    else:
+        is_digits = str.isdecimal
+
+    # The common shapes get their own closures, avoiding the slice for values without a newline
+    if minimum == 1 and maximum is None:
+        def match(value: str) -> bool:
+            return is_digits(value) or (value[-1:] == "\n" and is_digits(value[:-1]))
+    elif minimum == maximum and minimum > 0:
+        def match(value: str) -> bool:
+            length = len(value)
+            if length == minimum:
+                return is_digits(value)
+            return length == minimum + 1 and value[-1] == "\n" and is_digits(value[:-1])
+    else:
+        def match(value: str) -> bool:
+            if value[-1:] == "\n":
+                value = value[:-1]
+            length = len(value)
+            if length < minimum or (maximum is not None and length > maximum):
+                return False
+            return not value or is_digits(value)
+
+    return match
+
+@functools.lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> t.Optional[datetime]:
+    """Parses an ISO 8601 datetime string.
+
+    Results are memoized so that a value checked by several datetime rules
+    (or repeated across records) is only parsed once.
+
+    Args:
+        value (str): The string to parse.
+
+    Returns:
+        Optional[datetime]: The parsed datetime, or None if the string is not a valid ISO 8601 datetime.
+    """
+    # Every form accepted by `fromisoformat` starts with a four-digit year and is at
+    # least 7 characters long ("YYYYWww"); rejecting other strings up front avoids
+    # raising and catching a ValueError for them.
+    if len(value) < 7 or not value[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+# ISO 8601 formats, with the shape of the strings they match ("9" stands for an
+# ASCII digit). For strings of exactly that shape, `datetime.fromisoformat`
+# accepts the same values as `strptime` with the format.
+_ISO_FORMAT_SHAPES = {
+    "%Y-%m-%d": "9999-99-99",
+    "%Y-%m-%dT%H:%M": "9999-99-99T99:99",
+    "%Y-%m-%d %H:%M": "9999-99-99 99:99",
+    "%Y-%m-%dT%H:%M:%S": "9999-99-99T99:99:99",
+    "%Y-%m-%d %H:%M:%S": "9999-99-99 99:99:99",
+}
+_DIGITS_TO_NINE = str.maketrans("012345678", "999999999")
+
+@functools.lru_cache(maxsize=1024)
+def _matches_format(value: str, format_string: str) -> bool:
+    """Checks whether a string can be parsed with a strptime format.
+
+    `strptime` is implemented in Python and is slow, so strings in the shape
+    of a common ISO 8601 format are parsed with `datetime.fromisoformat`
+    instead, which gives the same result for them. Results are memoized on
+    the value and format, so that a value repeated across records is only
+    parsed once per format.
+
+    Args:
+        value (str): The string to parse.
+        format_string (str): The strptime format the string must match.
+
+    Returns:
+        bool: True if the string matches the format, False otherwise.
+    """
+    shape = _ISO_FORMAT_SHAPES.get(format_string)
+    try:
+        if shape is not None and value.translate(_DIGITS_TO_NINE) == shape:
+            datetime.fromisoformat(value)
+        else:
+            datetime.strptime(value, format_string)
+        return True
+    except ValueError:
+        return False
+
+# Syntax that `json` accepts but orjson may reject: NaN and infinities, integers
+# beyond 64 bits, exponents that overflow float64, and unpaired surrogates
+_ORJSON_REJECTED_SYNTAX = re.compile(r"NaN|Infinity|\d{20}|[eE][+-]?\d{3}|\\u[dD][89a-fA-F]|[\ud800-\udfff]")
+
+@functools.lru_cache(maxsize=1024)
+def _is_json(value: str) -> bool:
+    """Checks whether a string is valid JSON.
+
+    Results are memoized so that a payload checked by several JSON rules
+    (or repeated across records) is only parsed once. When orjson is
+    installed it is the only parser used, except for strings it rejects that
+    contain syntax `json` accepts and orjson does not (NaN and infinities,
+    integers beyond 64 bits, exponents that overflow, unpaired surrogates).
+    Those are parsed again with `json`, so the result does not depend on
+    which parser is installed.
+
+    Args:
+        value (str): The string to parse.
+
+    Returns:
+        bool: True if the string is valid JSON, False otherwise.
+    """
+    if orjson is not None:
+        try:
+            orjson.loads(value)
+            return True
+        except orjson.JSONDecodeError:
+            if _ORJSON_REJECTED_SYNTAX.search(value) is None:
+                return False
+    try:
+        json.loads(value)
+        return True
+    except json.JSONDecodeError:
+        return False
+
+# Results memoized by `cached_validate`, keyed on the identities of the rule,
+# data and context. Each entry also holds those objects, so their ids cannot be
+# reused by new objects while the entry is cached.
+_RESULT_CACHE_SIZE = 256
+_result_cache: "collections.OrderedDict[t.Tuple[int, int, int], t.Tuple[t.Any, t.Dict, t.Any, bool]]" = collections.OrderedDict()
+_result_cache_lock = threading.Lock()  # The LRU bookkeeping takes several steps that must not interleave
+
+def cached_validate(is_valid: t.Callable[..., bool]) -> t.Callable[..., bool]:
+    """Decorator that memoizes a rule's `is_valid` result for the same data.
+
+    Intended for custom rules with expensive checks that may be evaluated more
+    than once per record, for example inside combinators, whose error messages
+    re-check their children. Results are keyed on the identity of the data
+    dictionary, not its contents, so call `invalidate_cached_results` after
+    mutating data that has already been validated. The most recent results are
+    kept, together with strong references to their data.
+
+    Args:
+        is_valid (Callable[..., bool]): The `is_valid` method to memoize.
+
+    Returns:
+        Callable[..., bool]: The memoizing `is_valid` method.
+    """
+    @functools.wraps(is_valid)
+    def wrapper(self, data: t.Dict, context: "RuleContext" = None) -> bool:
+        key = (id(self), id(data), id(context))
+        with _result_cache_lock:
+            entry = _result_cache.get(key)
+            if entry is not None:
+                _result_cache.move_to_end(key)
+                return entry[3]
+        result = is_valid(self, data, context)  # Outside the lock, so slow checks run concurrently
+        with _result_cache_lock:
+            _result_cache[key] = (self, data, context, result)
+            if len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+        return result
+    return wrapper
+
+def invalidate_cached_results():
+    """Discards every result memoized by `cached_validate`."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+# Shared by every RuleContext created without data; read-only so that
+# no state can leak between contexts through it.
+_EMPTY_CONTEXT: t.Mapping = types.MappingProxyType({})
+
+def _field_name(field: t.Hashable) -> t.Hashable:
+    """Interns a string field name.
+
+    The keys of records written as literals or keyword arguments in code are
+    interned, so an interned field name lets `dict.get` match them by identity
+    instead of comparing characters. Other keys are returned unchanged.
+
+    Args:
+        field (Hashable): The field name.
+
+    Returns:
+        Hashable: The interned field name, or `field` itself if it is not a `str`.
+    """
+    return sys.intern(field) if type(field) is str else field
+
+def _within_bounds(values: "np.ndarray", minimum, maximum) -> "np.ndarray":
+    """Returns a boolean array that is True where a value is within optional inclusive bounds.
+
+    The out-of-range flags are combined in place, so only one boolean array is
+    allocated besides the comparison results. NaN is not rejected by either bound.
+    """
+    np = _numpy()
+    if minimum is not None:
+        invalid = values < minimum
+        if maximum is not None:
+            np.logical_or(invalid, values > maximum, out=invalid)
+    elif maximum is not None:
+        invalid = values > maximum
+    else:
+        return np.ones(values.shape, dtype=bool)
+    return np.logical_not(invalid, out=invalid)
+
+# The Python type `tolist` produces for each NumPy dtype kind that maps to a single type
+_PYTHON_TYPES_BY_KIND = {"b": bool, "i": int, "u": int, "f": float, "c": complex, "U": str, "S": bytes}
+
+def _as_column(values: t.Sequence[t.Any]) -> "np.ndarray":
+    """Converts a column to a NumPy array without changing the types of its values.
+
+    `np.asarray` converts a list of mixed types to a common dtype, turning
+    booleans into numbers or numbers into strings, which would let
+    `validate_column` accept values that `is_valid` rejects. Such lists become
+    object arrays instead, so they are checked value by value. Arrays are
+    returned unchanged.
+
+    Args:
+        values (Sequence[t.Any]): The column values.
+
+    Returns:
+        np.ndarray: The values as an array.
+    """
+    np = _numpy()
+    if isinstance(values, np.ndarray):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind != "O" and set(map(type, values)) != {_PYTHON_TYPES_BY_KIND.get(array.dtype.kind)}:
+        array = np.array(values, dtype=object)
+    return array
+
+def _datetime_column(values: "np.ndarray") -> t.Optional["np.ndarray"]:
+    """Returns a datetime64 column in a unit whose `tolist` gives datetime objects.
+
+    Columns finer than microseconds, such as pandas' datetime64[ns], would
+    convert to integers; they are truncated to microseconds, the precision of
+    `datetime`.
+
+    Args:
+        values (np.ndarray): The column values.
+
+    Returns:
+        Optional[np.ndarray]: The column, or None if it does not hold datetimes
+            (including datetime64 columns of dates).
+    """
+    np = _numpy()
+    if values.dtype.kind != "M":
+        return None
+    unit = np.datetime_data(values.dtype)[0]
+    if unit in ("h", "m", "s", "ms", "us"):
+        return values
+    if unit in ("ns", "ps", "fs", "as"):
+        return values.astype("datetime64[us]")
+    return None
+
+def _validate_values(rule: "Rule", values: "np.ndarray") -> "np.ndarray":
+    """Checks a column one value at a time with the rule's `is_valid`.
+
+    Used by `validate_column` for columns whose dtype cannot be checked with
+    vectorized operations. Values are converted with `tolist` so that the rule
+    sees plain Python objects.
+    """
+    np = _numpy()
+    return np.fromiter((rule.is_valid({rule.field: value}) for value in values.tolist()), dtype=bool, count=len(values))
+
 
 class RuleContext:
     """Provides context to rules during validation.
@@ -10,25 +431,30 @@ class RuleContext:
     Can be extended for application-specific needs.
 
     Attributes:
-        context (t.Dict, optional): A dictionary containing contextual data. Defaults to {}.
+        context (t.Mapping): A mapping containing contextual data. Defaults to a shared,
+            read-only empty mapping.
     """
 
-    def __init__(self, data: t.Dict = {}):
+    def __init__(self, data: t.Optional[t.Dict] = None):
         """Initializes a new RuleContext."""
-        self.context = data
+        self.context = data if data is not None else _EMPTY_CONTEXT
 
     def __str__(self):
         """Returns a string representation of the RuleContext."""
         return str(self.context)
 
-class Rule(ABC):
+class Rule:
     """Base class for all validation rules.
 
     Rules define a specific validation check. Subclasses must implement
     the `is_valid` and `error_message` methods.
+
+    Rules declare `__slots__` so that instances carry no per-instance
+    dictionary; subclasses should list the attributes they set.
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the rule is valid for the given data.
 
@@ -40,9 +466,8 @@ class Rule(ABC):
         Returns:
             bool: True if the data is valid, False otherwise.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the rule is not valid.
 
@@ -54,29 +479,60 @@ class Rule(ABC):
         Returns:
             str: An error message describing the validation failure.
         """
-        pass
+        raise NotImplementedError
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Validates the data and describes the failure in a single call.
+
+        Subclasses may override this to avoid repeating work (such as fetching
+        and converting the value) that `is_valid` and `error_message` would each
+        perform.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule.
+                Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        if self.is_valid(data, context):
+            return None
+        return self.error_message(data, context)
 
-    def __and__(self, other: "Rule") -> "AndRule":
+    def __and__(self, other: "Rule") -> "AllOf":
         """Combines this rule with another rule using a logical AND.
 
+        Chains such as `a & b & c` are flattened into a single AllOf rather
+        than nested pairs, so they are evaluated in one loop.
+
         Args:
             other (Rule): The other rule to combine with.
 
         Returns:
-            AndRule: A new AndRule object that combines the two rules.
+            AllOf: An AndRule combining the two rules, or an AllOf of every rule in the chain.
         """
-        return AndRule(self, other)
+        children = _flatten(self, (AllOf, AndRule)) + _flatten(other, (AllOf, AndRule))
+        if len(children) == 2:
+            return AndRule(*children)
+        return AllOf(children)
 
-    def __or__(self, other: "Rule") -> "OrRule":
+    def __or__(self, other: "Rule") -> "AnyOf":
         """Combines this rule with another rule using a logical OR.
 
+        Chains such as `a | b | c` are flattened into a single AnyOf rather
+        than nested pairs, so they are evaluated in one loop.
+
         Args:
             other (Rule): The other rule to combine with.
 
         Returns:
-            OrRule: A new OrRule object that combines the two rules.
+            AnyOf: An OrRule combining the two rules, or an AnyOf of every rule in the chain.
         """
-        return OrRule(self, other)
+        children = _flatten(self, (AnyOf, OrRule)) + _flatten(other, (AnyOf, OrRule))
+        if len(children) == 2:
+            return OrRule(*children)
+        return AnyOf(children)
 
     def __invert__(self) -> "NotRule":
         """Negates this rule.
@@ -91,36 +547,49 @@ class Rule(ABC):
         """Returns a string representation of the rule (the error message)."""
         return self.error_message
 
-class AndRule(Rule):
-    """Combines two rules with a logical AND.
+def _flatten(rule: Rule, combinators: t.Tuple[type, ...]) -> t.Tuple[Rule, ...]:
+    """Returns the children of `rule` if it is exactly one of `combinators`, otherwise `(rule,)`.
 
-    The data must be valid according to both rules for the AndRule to be valid.
+    Other subclasses are kept intact, since they may override how their
+    children are evaluated.
     """
+    if type(rule) in combinators:
+        return rule.children
+    return (rule,)
 
-    def __init__(self, rule1: Rule, rule2: Rule):
-        """Initializes a new AndRule.
+class AllOf(Rule):
+    """Combines any number of rules with a logical AND.
+
+    The data must be valid according to every rule for the AllOf to be valid.
+    """
+
+    __slots__ = ("children",)
+
+    def __init__(self, rules: t.Iterable[Rule]):
+        """Initializes a new AllOf.
 
         Args:
-            rule1 (Rule): The first rule.
-            rule2 (Rule): The second rule.
+            rules (Iterable[Rule]): The rules to combine.
         """
-        self.rule1 = rule1
-        self.rule2 = rule2
+        self.children = tuple(rules)
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
-        """Checks if the data is valid according to both rules.
+        """Checks if the data is valid according to every rule.
 
         Args:
             data (t.Dict): The data to validate.
             context (RuleContext, optional): Contextual information for the rules. Defaults to None.
 
         Returns:
-            bool: True if the data is valid according to both rules, False otherwise.
+            bool: True if the data is valid according to every rule, False otherwise.
         """
-        return self.rule1.is_valid(data, context) and self.rule2.is_valid(data, context)
+        for rule in self.children:
+            if not rule.is_valid(data, context):
+                return False
+        return True
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
-        """Returns an error message if the data is not valid according to either rule.
+        """Returns the error message of the first rule the data is not valid for.
 
         Args:
             data (t.Dict): The data that failed validation.
@@ -129,32 +598,51 @@ class AndRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        if not self.rule1.is_valid(data, context):
-            return self.rule1.error_message(data, context)
-        else:
-            return self.rule2.error_message(data, context)
+        for rule in self.children[:-1]:
+            error = rule.check(data, context)
+            if error is not None:
+                return error
+        return self.children[-1].error_message(data, context)
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the rules in order, returning the error message of the first one that fails.
 
+        Each child is evaluated once, through its own `check`, so nested
+        combinators do not re-evaluate their subtrees to build the message.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        for rule in self.children:
+            error = rule.check(data, context)
+            if error is not None:
+                return error
+        return None
 
     def __str__(self):
-        """Returns a string representation of the AndRule."""
-        return f'AndRule {str(self.rule1)} AND {str(self.rule2)}'
+        """Returns a string representation of the AllOf."""
+        return f'AllOf {" AND ".join(str(rule) for rule in self.children)}'
 
-class OrRule(Rule):
-    """Combines two rules with a logical OR.
+class AnyOf(Rule):
+    """Combines any number of rules with a logical OR.
 
     The data must be valid according to at least one of the rules for the
-    OrRule to be valid.
+    AnyOf to be valid.
     """
 
-    def __init__(self, rule1: Rule, rule2: Rule):
-        """Initializes a new OrRule.
+    __slots__ = ("children",)
+
+    def __init__(self, rules: t.Iterable[Rule]):
+        """Initializes a new AnyOf.
 
         Args:
-            rule1 (Rule): The first rule.
-            rule2 (Rule): The second rule.
+            rules (Iterable[Rule]): The rules to combine.
         """
-        self.rule1 = rule1
-        self.rule2 = rule2
+        self.children = tuple(rules)
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the data is valid according to at least one of the rules.
@@ -166,10 +654,13 @@ class OrRule(Rule):
         Returns:
             bool: True if the data is valid according to at least one of the rules, False otherwise.
         """
-        return self.rule1.is_valid(data, context) or self.rule2.is_valid(data, context)
+        for rule in self.children:
+            if rule.is_valid(data, context):
+                return True
+        return False
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
-        """Returns an error message if the data is not valid according to either rule.
+        """Returns an error message listing why each of the rules failed.
 
         Args:
             data (t.Dict): The data that failed validation.
@@ -178,8 +669,96 @@ class OrRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        return f"Both rules failed: {self.rule1.error_message(data, context)} OR {self.rule2.error_message(data, context)}"
+        return self._failure_message([rule.error_message(data, context) for rule in self.children])
 
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the rules in order, returning an error message only if all of them fail.
+
+        Each child is evaluated once, through its own `check`, and evaluation
+        stops at the first rule the data is valid for.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        errors = []
+        for rule in self.children:
+            error = rule.check(data, context)
+            if error is None:
+                return None
+            errors.append(error)
+        return self._failure_message(errors)
+
+    def _failure_message(self, errors: t.List[str]) -> str:
+        """Joins the children's error messages into the AnyOf's error message."""
+        prefix = "Both rules failed" if len(errors) == 2 else "All rules failed"
+        return f"{prefix}: " + " OR ".join(errors)
+
+    def __str__(self):
+        """Returns a string representation of the AnyOf."""
+        return f'AnyOf {" OR ".join(str(rule) for rule in self.children)}'
+
+class AndRule(AllOf):
+    """Combines two rules with a logical AND.
+
+    The data must be valid according to both rules for the AndRule to be valid.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, rule1: Rule, rule2: Rule):
+        """Initializes a new AndRule.
+
+        Args:
+            rule1 (Rule): The first rule.
+            rule2 (Rule): The second rule.
+        """
+        super().__init__((rule1, rule2))
+
+    @property
+    def rule1(self) -> Rule:
+        """Rule: The first rule."""
+        return self.children[0]
+
+    @property
+    def rule2(self) -> Rule:
+        """Rule: The second rule."""
+        return self.children[1]
+
+    def __str__(self):
+        """Returns a string representation of the AndRule."""
+        return f'AndRule {str(self.rule1)} AND {str(self.rule2)}'
+
+class OrRule(AnyOf):
+    """Combines two rules with a logical OR.
+
+    The data must be valid according to at least one of the rules for the
+    OrRule to be valid.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, rule1: Rule, rule2: Rule):
+        """Initializes a new OrRule.
+
+        Args:
+            rule1 (Rule): The first rule.
+            rule2 (Rule): The second rule.
+        """
+        super().__init__((rule1, rule2))
+
+    @property
+    def rule1(self) -> Rule:
+        """Rule: The first rule."""
+        return self.children[0]
+
+    @property
+    def rule2(self) -> Rule:
+        """Rule: The second rule."""
+        return self.children[1]
 
     def __str__(self):
         """Returns a string representation of the OrRule."""
@@ -191,6 +770,8 @@ class NotRule(Rule):
     The data must *not* be valid according to the rule for the NotRule to be valid.
     """
 
+    __slots__ = ("rule",)
+
     def __init__(self, rule: Rule):
         """Initializes a new NotRule.
 
@@ -223,6 +804,16 @@ class NotRule(Rule):
         """
         return f"Rule should not have been valid: {self.rule.error_message(data, context)}"
 
+    def __invert__(self) -> Rule:
+        """Negates this rule, cancelling the double negation.
+
+        Returns:
+            Rule: The rule this NotRule negates, so `~~rule` is `rule` itself.
+        """
+        if type(self) is not NotRule:
+            return super().__invert__()  # Subclasses may not be plain negations
+        return self.rule
+
     def __str__(self):
         """Returns a string representation of the NotRule."""
         return f'NotRule NOT ({str(self.rule)})'
@@ -237,13 +828,16 @@ class StringRule(Rule):
     Provides a helper method for retrieving the string value from the data.
     """
 
+    __slots__ = ("field", "_type_error")
+
     def __init__(self, field: str):
         """Initializes a new StringRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        self.field = field
+        self.field = _field_name(field)
+        self._type_error = f"Field '{field}' must be a string"
 
     def _get_value(self, data: t.Dict) -> str:
         """Helper method to get the string value from the data.
@@ -255,9 +849,9 @@ class StringRule(Rule):
             str: The string value of the field, or None if the field is not a string.
         """
         value = data.get(self.field)
-        if not isinstance(value, str):
-            return None  # Or raise an exception if you prefer strict type checking
-        return value
+        if type(value) is str or isinstance(value, str):
+            return value
+        return None  # Or raise an exception if you prefer strict type checking
 
 class StringLengthRule(StringRule):
     """Checks if a string's length falls within a specified range.
@@ -266,6 +860,8 @@ class StringLengthRule(StringRule):
     than or equal to `max_length` (inclusive).
     """
 
+    __slots__ = ("min_length", "max_length", "_check", "_length_error")
+
     def __init__(self, field: str, min_length: int = None, max_length: int = None):
         """Initializes a new StringLengthRule.
 
@@ -277,6 +873,25 @@ class StringLengthRule(StringRule):
         super().__init__(field)
         self.min_length = min_length
         self.max_length = max_length
+        self._check = self._make_check()
+        self._length_error = self._length_message()
+
+    def _make_check(self) -> t.Callable[[str], bool]:
+        """Builds the length check for the configured bounds.
+
+        Choosing the check once avoids testing which bounds are set on every call.
+
+        Returns:
+            Callable[[str], bool]: A function returning True if a string's length is within the bounds.
+        """
+        min_length, max_length = self.min_length, self.max_length
+        if min_length is not None and max_length is not None:
+            return lambda value: min_length <= len(value) <= max_length
+        if min_length is not None:
+            return lambda value: len(value) >= min_length
+        if max_length is not None:
+            return lambda value: len(value) <= max_length
+        return lambda value: True
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the string's length is within the specified range.
@@ -288,30 +903,29 @@ class StringLengthRule(StringRule):
         Returns:
             bool: True if the string's length is within the specified range, False otherwise.
         """
-        value = self._get_value(data)
-        if value is None:
-            return False
-        length = len(value)
-        if self.min_length is not None and length < self.min_length:
-            return False
-        if self.max_length is not None and length > self.max_length:
-            return False
-        return True
+        value = data.get(self.field)
+        # `type(...) is str` is cheaper than isinstance for the common exact-type case
+        return (type(value) is str or isinstance(value, str)) and self._check(value)
 
-    def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
-        """Returns an error message if the string's length is not within the specified range.
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the string's length, returning an error message if it is not within the specified range.
 
         Args:
-            data (t.Dict): The data that failed validation.
+            data (t.Dict): The data to validate.
             context (RuleContext, optional): Contextual information for the rule. Defaults to None.
 
         Returns:
-            str: An error message describing the validation failure.
+            Optional[str]: None if the data is valid, otherwise an error message.
         """
-        value = self._get_value(data)
-        if value is None:
-            return f"Field '{self.field}' must be a string"
-
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
+            return self._type_error
+        if self._check(value):
+            return None
+        return self._length_error
+
+    def _length_message(self) -> str:
+        """Builds the error message describing the allowed length range; called once by `__init__`."""
         if self.min_length is not None and self.max_length is not None:
             return f"Field '{self.field}' must be between {self.min_length} and {self.max_length} characters long"
         elif self.min_length is not None:
@@ -319,23 +933,80 @@ class StringLengthRule(StringRule):
         else:
             return f"Field '{self.field}' must be at most {self.max_length} characters long"
 
+    def validate_column(self, values: t.Sequence[str]) -> "np.ndarray":
+        """Checks a whole column of strings at once using NumPy.
+
+        For columns with a string dtype, the lengths are computed and compared
+        with vectorized NumPy operations. Other columns (such as
+        mixed types) are checked value by value.
+
+        Args:
+            values (Sequence[str]): The values to check.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the value has a length within the range.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("StringLengthRule.validate_column requires NumPy")
+        np = _numpy()
+        values = _as_column(values)
+        if values.dtype.kind != "U":
+            return _validate_values(self, values)
+        return _within_bounds(np.char.str_len(values), self.min_length, self.max_length)
+
+    def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
+        """Returns an error message if the string's length is not within the specified range.
+
+        Args:
+            data (t.Dict): The data that failed validation.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            str: An error message describing the validation failure.
+        """
+        value = self._get_value(data)
+        if value is None:
+            return self._type_error
+        return self._length_error
+
 
 class StringRegexRule(StringRule):
     """Checks if a string matches a specified regular expression.
 
     The string must match the regular expression for the StringRegexRule
-    to be valid.
+    to be valid. With the default engine, patterns that are plain literals
+    or digit runs (such as `^\\d{5}$`) are checked with string operations
+    instead of the regular expression engine.
     """
 
-    def __init__(self, field: str, regex: str):
+    __slots__ = ("regex", "engine", "_pattern", "_match", "_match_error")
+
+    def __init__(self, field: str, regex: str, engine: str = "re"):
         """Initializes a new StringRegexRule.
 
         Args:
             field (str): The name of the field to validate.
             regex (str): The regular expression to match.
+            engine (str, optional): The regular expression engine: "re", "re2" (linear-time
+                matching), "pcre2" (JIT-compiled, fastest on long strings) or "dfa"
+                (linear-time, pure Python). Defaults to "re".
+
+        Raises:
+            ValueError: If the engine is not recognised.
+            ImportError: If the engine's package is not installed.
         """
         super().__init__(field)
         self.regex = regex
+        self.engine = engine
+        self._pattern = _compile_regex(regex, engine)
+        # The literal shortcuts follow `re` semantics, so other engines always match through their pattern
+        self._match = (  # Result is truthy on a match
+            (engine == "re" and (_literal_matcher(regex) or _digits_matcher(regex))) or self._pattern.match
+        )
+        self._match_error = f"Field '{field}' must match the regular expression: {regex}"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the string matches the regular expression.
@@ -347,10 +1018,27 @@ class StringRegexRule(StringRule):
         Returns:
             bool: True if the string matches the regular expression, False otherwise.
         """
-        value = self._get_value(data)
-        if value is None:
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
             return False
-        return re.match(self.regex, value) is not None
+        return bool(self._match(value))
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the string, returning an error message if it does not match the regular expression.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
+            return self._type_error
+        if self._match(value):
+            return None
+        return self._match_error
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the string does not match the regular expression.
@@ -364,8 +1052,202 @@ class StringRegexRule(StringRule):
         """
         value = self._get_value(data)
         if value is None:
-            return f"Field '{self.field}' must be a string"
-        return f"Field '{self.field}' must match the regular expression: {self.regex}"
+            return self._type_error
+        return self._match_error
+
+
+# Characters for which Hyperscan's `\d`, `\w` and `\s` differ from `re`: everything outside ASCII, and
+# the ASCII separators `\x1c`-`\x1f`, which `re` treats as whitespace
+_HYPERSCAN_MISMATCHED_CHARACTERS = re.compile(r"[^\x00-\x1b\x20-\x7f]")
+
+
+class HyperscanRuleSet:
+    """Matches many StringRegexRules at once using Intel Hyperscan.
+
+    The patterns of all rules that target the same field are compiled into a
+    single Hyperscan database, so each field value is scanned once regardless of
+    how many rules apply to it. A rule matches when one of its matches starts at
+    the beginning of the value, mirroring the `re.match` semantics of
+    `StringRegexRule`. The rules' own `is_valid` is used instead where
+    Hyperscan's semantics differ: for fields whose patterns it cannot compile
+    (e.g. backreferences, or patterns that match the empty string), for rules
+    using another engine or `\\Z`, and for values whose characters it
+    classifies differently from `re` (such as non-ASCII digits).
+    """
+
+    def __init__(self, rules: t.List[StringRegexRule]):
+        """Initializes a new HyperscanRuleSet.
+
+        Args:
+            rules (List[StringRegexRule]): The regular expression rules to match.
+
+        Raises:
+            ImportError: If the `hyperscan` package is not installed.
+        """
+        if hyperscan is None:
+            raise ImportError("HyperscanRuleSet requires the 'hyperscan' package")
+        self.rules = list(rules)
+        # For each field: its database, the rules it scans, the rules checked on their own, and all its rules
+        self._databases: t.Dict[str, t.Tuple[t.Any, t.List[int], t.List[int], t.List[int]]] = {}
+        rule_ids_by_field: t.Dict[str, t.List[int]] = {}
+        for rule_id, rule in enumerate(self.rules):
+            rule_ids_by_field.setdefault(rule.field, []).append(rule_id)
+        for field, rule_ids in rule_ids_by_field.items():
+            # Python's `\Z` only matches at the very end; Hyperscan's also matches before a final newline
+            scanned_ids = [
+                rule_id for rule_id in rule_ids
+                if self.rules[rule_id].engine == "re" and "\\Z" not in self.rules[rule_id].regex
+            ]
+            database = None
+            if scanned_ids:
+                database = hyperscan.Database()
+                try:
+                    database.compile(
+                        expressions=[self.rules[rule_id].regex.encode("utf-8") for rule_id in scanned_ids],
+                        ids=scanned_ids,
+                        elements=len(scanned_ids),
+                        flags=hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8,
+                    )
+                except hyperscan.error:
+                    database, scanned_ids = None, []
+            unscanned_ids = [rule_id for rule_id in rule_ids if rule_id not in scanned_ids]
+            self._databases[field] = (database, scanned_ids, unscanned_ids, rule_ids)
+
+    @staticmethod
+    def _on_match(rule_id: int, start: int, end: int, flags: int, matched: t.Set[int]):
+        """Hyperscan match callback recording rules that match from the start of the value."""
+        if start == 0:
+            matched.add(rule_id)
+
+    def failed_rules(self, data: t.Dict, context: RuleContext = None) -> t.List[StringRegexRule]:
+        """Returns the rules that the given data does not satisfy.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            List[StringRegexRule]: The failing rules, in the order they were given.
+        """
+        failed_ids = []
+        for field, (database, scanned_ids, unscanned_ids, rule_ids) in self._databases.items():
+            value = data.get(field)
+            if not isinstance(value, str):
+                failed_ids.extend(rule_ids)
+                continue
+            if database is None or _HYPERSCAN_MISMATCHED_CHARACTERS.search(value):
+                unscanned_ids = rule_ids
+            else:
+                matched: t.Set[int] = set()
+                database.scan(value.encode("utf-8"), match_event_handler=self._on_match, context=matched)
+                failed_ids.extend(rule_id for rule_id in scanned_ids if rule_id not in matched)
+            failed_ids.extend(rule_id for rule_id in unscanned_ids if not self.rules[rule_id].is_valid(data, context))
+        return [self.rules[rule_id] for rule_id in sorted(failed_ids)]
+
+    def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
+        """Checks if the data satisfies every rule in the set.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            bool: True if every rule matches, False otherwise.
+        """
+        return not self.failed_rules(data, context)
+
+    def validate(self, data: t.Dict, context: RuleContext = None) -> t.List[str]:
+        """Validates the data against every rule in the set.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            t.List[str]: A list of error messages. If the list is empty, the data is valid.
+        """
+        return [rule.error_message(data, context) for rule in self.failed_rules(data, context)]
+
+    def validate_batch(self, records: t.Iterable[t.Dict], context: RuleContext = None) -> t.List[t.List[str]]:
+        """Validates a batch of records against every rule in the set.
+
+        Args:
+            records (Iterable[t.Dict]): The records to validate.
+            context (RuleContext, optional): Contextual information for the rules. Defaults to None.
+
+        Returns:
+            t.List[t.List[str]]: The error messages for each record, in input order.
+        """
+        return [self.validate(data, context) for data in records]
+
+
+EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+
+_EMAIL_LOCAL_CHARS = string.ascii_letters + string.digits + "._%+-"
+_EMAIL_DOMAIN_CHARS = string.ascii_letters + string.digits + ".-"
+
+
+class EmailRule(StringRegexRule):
+    """Checks if a string is an email address.
+
+    Accepts exactly the strings matched by `EMAIL_REGEX`, but uses a
+    purpose-built scanner instead of the regular expression engine.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, field: str):
+        """Initializes a new EmailRule.
+
+        Args:
+            field (str): The name of the field to validate.
+        """
+        super().__init__(field, EMAIL_REGEX)
+
+    def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
+        """Checks if the string is an email address.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            bool: True if the string is an email address, False otherwise.
+        """
+        value = data.get(self.field)
+        return (type(value) is str or isinstance(value, str)) and self._is_email(value)
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the string, returning an error message if it is not an email address.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
+            return self._type_error
+        if self._is_email(value):
+            return None
+        return self._match_error
+
+    @staticmethod
+    def _is_email(value: str) -> bool:
+        """Scans a string for the email address shape described by `EMAIL_REGEX`."""
+        if value.endswith("\n"):
+            value = value[:-1]  # Like the regex's `$`, allow a single trailing newline
+        local, at, domain = value.partition("@")
+        # `str.strip(chars)` returns an empty string only if every character is in `chars`
+        if not local or not at or local.strip(_EMAIL_LOCAL_CHARS):
+            return False
+        dot = domain.rfind(".")
+        if dot < 1 or domain.strip(_EMAIL_DOMAIN_CHARS):
+            return False
+        top_level_domain = domain[dot + 1:]
+        return len(top_level_domain) >= 2 and not top_level_domain.strip(string.ascii_letters)
 
 
 class StringChoicesRule(StringRule):
@@ -375,6 +1257,8 @@ class StringChoicesRule(StringRule):
     to be valid.
     """
 
+    __slots__ = ("choices", "_choice_set", "_choices_error")
+
     def __init__(self, field: str, choices: t.List[str]):
         """Initializes a new StringChoicesRule.
 
@@ -384,6 +1268,8 @@ class StringChoicesRule(StringRule):
         """
         super().__init__(field)
         self.choices = choices
+        self._choice_set = frozenset(choices)  # Hashed membership; `choices` keeps the order for messages
+        self._choices_error = f"Field '{field}' must be one of the following choices: {choices}"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the string is one of the specified choices.
@@ -395,10 +1281,50 @@ class StringChoicesRule(StringRule):
         Returns:
             bool: True if the string is one of the specified choices, False otherwise.
         """
-        value = self._get_value(data)
-        if value is None:
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
             return False
-        return value in self.choices
+        return value in self._choice_set
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the string, returning an error message if it is not one of the specified choices.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if not (type(value) is str or isinstance(value, str)):
+            return self._type_error
+        if value in self._choice_set:
+            return None
+        return self._choices_error
+
+    def validate_column(self, values: t.Sequence[str]) -> "np.ndarray":
+        """Checks a whole column of strings at once using NumPy.
+
+        For columns with a string dtype, membership is tested with `np.isin`. Other columns (such as
+        mixed types) are checked value by value.
+
+        Args:
+            values (Sequence[str]): The values to check.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the value is one of the choices.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("StringChoicesRule.validate_column requires NumPy")
+        np = _numpy()
+        values = _as_column(values)
+        if values.dtype.kind != "U":
+            return _validate_values(self, values)
+        return np.isin(values, self.choices)
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the string is not one of the specified choices.
@@ -412,8 +1338,8 @@ class StringChoicesRule(StringRule):
         """
         value = self._get_value(data)
         if value is None:
-            return f"Field '{self.field}' must be a string"
-        return f"Field '{self.field}' must be one of the following choices: {self.choices}"
+            return self._type_error
+        return self._choices_error
 
 
     # -----------------------------------------------------------------------------
@@ -424,15 +1350,19 @@ class NumberRule(Rule):
     """Base class for number-based rules.
 
     Provides a helper method for retrieving the number value from the data.
+    Booleans are not numbers for these rules, although `bool` subclasses `int`.
     """
 
+    __slots__ = ("field", "_type_error")
+
     def __init__(self, field: str):
         """Initializes a new NumberRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        self.field = field
+        self.field = _field_name(field)
+        self._type_error = f"Field '{field}' must be a number"
 
     def _get_value(self, data: t.Dict) -> t.Union[int, float, None]:
         """Helper method to get the number value from the data.
@@ -444,7 +1374,7 @@ class NumberRule(Rule):
             Union[int, float, None]: The number value of the field, or None if the field is not a number.
         """
         value = data.get(self.field)
-        if not isinstance(value, (int, float)):
+        if type(value) is bool or not isinstance(value, (int, float)):
             return None  # Or raise an exception if you prefer strict type checking
         return value
 
@@ -456,6 +1386,8 @@ class NumberRangeRule(NumberRule):
     than or equal to `max_value` (inclusive).
     """
 
+    __slots__ = ("min_value", "max_value", "_range_error")
+
     def __init__(self, field: str, min_value: t.Union[int, float] = None, max_value: t.Union[int, float] = None):
         """Initializes a new NumberRangeRule.
 
@@ -467,6 +1399,7 @@ class NumberRangeRule(NumberRule):
         super().__init__(field)
         self.min_value = min_value
         self.max_value = max_value
+        self._range_error = self._range_message()
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the number is within the specified range.
@@ -478,8 +1411,8 @@ class NumberRangeRule(NumberRule):
         Returns:
             bool: True if the number is within the specified range, False otherwise.
         """
-        value = self._get_value(data)
-        if value is None:
+        value = data.get(self.field)
+        if type(value) is bool or not isinstance(value, (int, float)):
             return False
         if self.min_value is not None and value < self.min_value:
             return False
@@ -487,6 +1420,30 @@ class NumberRangeRule(NumberRule):
             return False
         return True
 
+    def validate_column(self, values: t.Sequence[t.Union[int, float]]) -> "np.ndarray":
+        """Checks a whole column of numbers at once using NumPy.
+
+        For columns with a numeric dtype, the comparisons run as vectorized NumPy
+        operations instead of one `is_valid` call per value. Other columns (such
+        as mixed types) are checked value by value. As in `is_valid`, NaN is not
+        rejected by either bound.
+
+        Args:
+            values (Sequence[Union[int, float]]): The numbers to check.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the value is within the range.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("NumberRangeRule.validate_column requires NumPy")
+        values = _as_column(values)
+        if values.dtype.kind not in "iuf":
+            return _validate_values(self, values)
+        return _within_bounds(values, self.min_value, self.max_value)
+
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the number is not within the specified range.
 
@@ -499,7 +1456,28 @@ class NumberRangeRule(NumberRule):
         """
         value = self._get_value(data)
         if value is None:
-            return f"Field '{self.field}' must be a number"
+            return self._type_error
+        return self._range_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks the number, returning an error message if it is not within the specified range.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if type(value) is bool or not isinstance(value, (int, float)):
+            return self._type_error
+        if (self.min_value is not None and value < self.min_value) or (self.max_value is not None and value > self.max_value):
+            return self._range_error
+        return None
+
+    def _range_message(self) -> str:
+        """Builds the error message describing the allowed range; called once by `__init__`."""
         if self.min_value is not None and self.max_value is not None:
             return f"Field '{self.field}' must be between {self.min_value} and {self.max_value}"
         elif self.min_value is not None:
@@ -518,13 +1496,16 @@ class DateTimeRule(Rule):
     Provides a helper method for retrieving the datetime value from the data.
     """
 
+    __slots__ = ("field", "_type_error")
+
     def __init__(self, field: str):
         """Initializes a new DateTimeRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        self.field = field
+        self.field = _field_name(field)
+        self._type_error = f"Field '{field}' must be a datetime or a string that can be converted to a datetime"
 
     def _get_value(self, data: t.Dict) -> t.Union[datetime, str, None]:
         """Helper method to get the datetime value from the data.
@@ -539,11 +1520,7 @@ class DateTimeRule(Rule):
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            try:
-                # Attempt to parse the string as a datetime
-                return datetime.fromisoformat(value)  # Or use a different parsing method
-            except ValueError:
-                return None  # Or raise an exception
+            return _parse_datetime(value)
         return None
 
 class DateTimeFormatRule(DateTimeRule):
@@ -553,6 +1530,8 @@ class DateTimeFormatRule(DateTimeRule):
     DateTimeFormatRule to be valid.
     """
 
+    __slots__ = ("format_string", "_format_error")
+
     def __init__(self, field: str, format_string: str):
         """Initializes a new DateTimeFormatRule.
 
@@ -562,6 +1541,7 @@ class DateTimeFormatRule(DateTimeRule):
         """
         super().__init__(field)
         self.format_string = format_string
+        self._format_error = f"Field '{field}' must be in the format: {format_string}"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the datetime string matches the specified format.
@@ -573,17 +1553,7 @@ class DateTimeFormatRule(DateTimeRule):
         Returns:
             bool: True if the datetime string matches the specified format, False otherwise.
         """
-        value = self._get_value(data)
-        if value is None:
-            return False
-        try:
-            if isinstance(value, datetime):
-                value.strftime(self.format_string)
-            else:
-                datetime.strptime(value, self.format_string) #Attempt to parse if it has not previously
-            return True
-        except ValueError:
-            return False
+        return self.check(data, context) is None  # `check` fetches and parses the value once
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the datetime string does not match the specified format.
@@ -597,9 +1567,31 @@ class DateTimeFormatRule(DateTimeRule):
         """
         value = data.get(self.field)
         if value is None:
-            return f"Field '{self.field}' must be a datetime or a string that can be converted to a datetime"
+            return self._type_error
+
+        return self._format_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks if the datetime string matches the specified format, returning an error message if it is not.
 
-        return f"Field '{self.field}' must be in the format: {self.format_string}"
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if isinstance(value, str):
+            # Strings are parsed with the format itself rather than as ISO 8601 first
+            return None if _matches_format(value, self.format_string) else self._format_error
+        if isinstance(value, datetime):
+            try:
+                value.strftime(self.format_string)
+                return None
+            except ValueError:
+                return self._format_error
+        return self._type_error if value is None else self._format_error
 
 class EndDateAfterStartDateRule(Rule):
     """Checks if an end date happens after a start date.
@@ -608,6 +1600,8 @@ class EndDateAfterStartDateRule(Rule):
     EndDateAfterStartDateRule to be valid.
     """
 
+    __slots__ = ("start_date_field", "end_date_field", "_order_error")
+
     def __init__(self, start_date_field: str, end_date_field: str):
         """Initializes a new EndDateAfterStartDateRule.
 
@@ -615,8 +1609,9 @@ class EndDateAfterStartDateRule(Rule):
             start_date_field (str): The name of the field containing the start date.
             end_date_field (str): The name of the field containing the end date.
         """
-        self.start_date_field = start_date_field
-        self.end_date_field = end_date_field
+        self.start_date_field = _field_name(start_date_field)
+        self.end_date_field = _field_name(end_date_field)
+        self._order_error = f"End date must be after start date. Start Date:'{start_date_field}', End Date:'{end_date_field}'"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the end date is after the start date in the given data.
@@ -647,7 +1642,40 @@ class EndDateAfterStartDateRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        return f"End date must be after start date. Start Date:'{self.start_date_field}', End Date:'{self.end_date_field}'"
+        return self._order_error
+
+    def validate_columns(self, start_dates: t.Sequence[t.Any], end_dates: t.Sequence[t.Any]) -> "np.ndarray":
+        """Checks whole columns of start and end dates at once using NumPy.
+
+        When both columns are datetime64 arrays, the end dates are compared with
+        the start dates in a single vectorized operation; NaT, like a missing
+        date, is never valid. Other columns are checked row by row.
+
+        Args:
+            start_dates (Sequence[t.Any]): The start dates.
+            end_dates (Sequence[t.Any]): The end dates, in the same order.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the end date is after the start date.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("EndDateAfterStartDateRule.validate_columns requires NumPy")
+        np = _numpy()
+        start_dates, end_dates = _as_column(start_dates), _as_column(end_dates)
+        start_column, end_column = _datetime_column(start_dates), _datetime_column(end_dates)
+        if start_column is not None and end_column is not None:
+            return end_column > start_column  # Comparisons with NaT are False
+        return np.fromiter(
+            (
+                self.is_valid({self.start_date_field: start, self.end_date_field: end})
+                for start, end in zip(start_dates.tolist(), end_dates.tolist())
+            ),
+            dtype=bool,
+            count=len(start_dates),
+        )
 
     # -----------------------------------------------------------------------------
     # Boolean Validation Rules
@@ -659,13 +1687,16 @@ class BooleanRule(Rule):
     The field must be a boolean value for the BooleanRule to be valid.
     """
 
+    __slots__ = ("field", "_boolean_error")
+
     def __init__(self, field: str):
         """Initializes a new BooleanRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        super().__init__(field)
+        self.field = _field_name(field)
+        self._boolean_error = f"Field '{field}' must be a boolean"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the field is a boolean.
@@ -677,7 +1708,30 @@ class BooleanRule(Rule):
         Returns:
             bool: True if the field is a boolean, False otherwise.
         """
-        return isinstance(data.get(self.field), bool)
+        return type(data.get(self.field)) is bool
+
+    def validate_column(self, values: t.Sequence[t.Any]) -> "np.ndarray":
+        """Checks a whole column of values at once using NumPy.
+
+        Columns with a boolean dtype are valid without inspecting their values. Other columns (such as
+        mixed types) are checked value by value.
+
+        Args:
+            values (Sequence[t.Any]): The values to check.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the value is a boolean.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("BooleanRule.validate_column requires NumPy")
+        np = _numpy()
+        values = _as_column(values)
+        if values.dtype.kind != "b":
+            return _validate_values(self, values)
+        return np.ones(values.shape, dtype=bool)
 
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the field is not a boolean.
@@ -689,7 +1743,21 @@ class BooleanRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        return f"Field '{self.field}' must be a boolean"
+        return self._boolean_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks if the field is a boolean, returning an error message if it is not.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        if type(data.get(self.field)) is bool:
+            return None
+        return self._boolean_error
 
     # -----------------------------------------------------------------------------
     # JSON Validation Rules
@@ -701,13 +1769,16 @@ class JSONRule(Rule):
     The field must contain a valid JSON string for the JSONRule to be valid.
     """
 
+    __slots__ = ("field", "_json_error")
+
     def __init__(self, field: str):
         """Initializes a new JSONRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        self.field = field
+        self.field = _field_name(field)
+        self._json_error = f"Field '{field}' must contain valid JSON"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the field contains valid JSON.
@@ -722,23 +1793,34 @@ class JSONRule(Rule):
         value = data.get(self.field)
         if not isinstance(value, str):
             return False  # JSON must be a string
-        try:
-            json.loads(value)  # Attempt to parse the JSON string
-            return True
-        except json.JSONDecodeError:
-            return False
+        return _is_json(value)
 
-        def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
-            """Returns an error message if the field does not contain valid JSON.
+    def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
+        """Returns an error message if the field does not contain valid JSON.
 
-            Args:
-                data (t.Dict): The data that failed validation.
-                context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+        Args:
+            data (t.Dict): The data that failed validation.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
 
-            Returns:
-                str: An error message describing the validation failure.
-            """
-            return f"Field '{self.field}' must contain valid JSON"
+        Returns:
+            str: An error message describing the validation failure.
+        """
+        return self._json_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks if the field contains valid JSON, returning an error message if it is not.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        value = data.get(self.field)
+        if isinstance(value, str) and _is_json(value):
+            return None
+        return self._json_error
 
     # -----------------------------------------------------------------------------
     # Type Validation Rules
@@ -750,15 +1832,19 @@ class TypeRule(Rule):
     The field must be of the specified type for the TypeRule to be valid.
     """
 
+    __slots__ = ("field", "expected_type", "_type_error")
+
     def __init__(self, field: str, expected_type: type):
         """Initializes a new TypeRule.
 
         Args:
             field (str): The name of the field to validate.
-            expected_type (type): The expected type of the field.
+            expected_type (type): The expected type of the field, or a tuple of types.
         """
-        self.field = field
+        self.field = _field_name(field)
         self.expected_type = expected_type
+        type_names = [expected.__name__ for expected in expected_type] if isinstance(expected_type, tuple) else [expected_type.__name__]
+        self._type_error = f"Field '{field}' must be of type {' or '.join(type_names)}"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the field is of the specified type.
@@ -772,6 +1858,31 @@ class TypeRule(Rule):
         """
         return isinstance(data.get(self.field), self.expected_type)
 
+    def validate_column(self, values: t.Sequence[t.Any]) -> "np.ndarray":
+        """Checks a whole column of values at once using NumPy.
+
+        The values of a boolean, integer, float, complex, string or bytes column
+        all convert to the same Python type, so the column is checked once from
+        its dtype. Other columns (such as mixed types) are checked value by value.
+
+        Args:
+            values (Sequence[t.Any]): The values to check.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the value is of the expected type.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("TypeRule.validate_column requires NumPy")
+        np = _numpy()
+        values = _as_column(values)
+        python_type = _PYTHON_TYPES_BY_KIND.get(values.dtype.kind)
+        if python_type is None:
+            return _validate_values(self, values)
+        return np.full(values.shape, issubclass(python_type, self.expected_type))
+
     def error_message(self, data: t.Dict, context: RuleContext = None) -> str:
         """Returns an error message if the field is not of the specified type.
 
@@ -782,7 +1893,21 @@ class TypeRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        return f"Field '{self.field}' must be of type {self.expected_type.__name__}"
+        return self._type_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks if the field is of the specified type, returning an error message if it is not.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        if isinstance(data.get(self.field), self.expected_type):
+            return None
+        return self._type_error
 # -----------------------------------------------------------------------------
 # Required Validation Rules
 # -----------------------------------------------------------------------------
@@ -792,13 +1917,17 @@ class RequiredRule(Rule):
 
     The field must be present in the data for the RequiredRule to be valid.
     """
+
+    __slots__ = ("field", "_required_error")
+
     def __init__(self, field: str):
         """Initializes a new RequiredRule.
 
         Args:
             field (str): The name of the field to validate.
         """
-        self.field = field
+        self.field = _field_name(field)
+        self._required_error = f"Field '{field}' is required"
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if a field is present in the data.
@@ -822,4 +1951,18 @@ class RequiredRule(Rule):
         Returns:
             str: An error message describing the validation failure.
         """
-        return f"Field '{self.field}' is required"
\ No newline at end of file
+        return self._required_error
+
+    def check(self, data: t.Dict, context: RuleContext = None) -> t.Optional[str]:
+        """Checks if the field is present in the data, returning an error message if it is not.
+
+        Args:
+            data (t.Dict): The data to validate.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            Optional[str]: None if the data is valid, otherwise an error message.
+        """
+        if self.field in data:
+            return None
+        return self._required_error
\ No newline at end of file
@@ -1,9 +1,58 @@
-from pyveritas.contracts import DataContract
 from pyveritas.validator import Validator
+import functools
 import importlib
 import typing as t
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve(module_name: str, name: str) -> t.Any:
+    """Imports a module and returns one of its attributes.
+
+    Results are memoized, so a suite whose test cases share a contract looks
+    the class up once.
+
+    Args:
+        module_name (str): The module to import.
+        name (str): The attribute to return.
+
+    Returns:
+        Any: The attribute.
+    """
+    return getattr(importlib.import_module(module_name), name)
+
+
+def _contract_class(contract: t.Union[str, type]) -> type:
+    """Returns the contract class a test case refers to.
+
+    Args:
+        contract (Union[str, type]): A DataContract subclass, the dotted path of one
+            ("package.module.ClassName"), or the name of a class in pyveritas.contracts.
+
+    Returns:
+        type: The contract class.
+    """
+    if isinstance(contract, type):
+        return contract
+    module_name, _, name = contract.rpartition(".")
+    return _resolve(module_name or "pyveritas.contracts", name)
+
+
+def _errors_match(errors: t.List[str], expected_errors: t.List[str]) -> bool:
+    """Checks whether a test case produced the expected errors, in any order.
+
+    Expected errors are usually listed in the order `validate` reports them,
+    so the lists are compared directly first, which avoids building two sets.
+
+    Args:
+        errors (t.List[str]): The errors reported by the validator.
+        expected_errors (t.List[str]): The errors the test case expects.
+
+    Returns:
+        bool: True if both contain the same error messages.
+    """
+    return errors == expected_errors or set(errors) == set(expected_errors)
+
+
 class TestRunner():
     """A test runner for DataContracts.
 
@@ -19,13 +68,17 @@ class TestRunner():
         """
         self.name = name
         self.test_cases: t.List[t.Dict] = []  # List of test case dictionaries
+        self._validators: t.Dict[t.Union[str, type], Validator] = {}  # One validator per contract
 
     def add(self, test_case: t.Dict):
         """Adds a test case to the suite.
 
         Args:
             test_case (t.Dict): A dictionary containing test case details
-                             (description, contract, data, expected_errors)
+                             (description, contract, data, expected_errors). The
+                             contract is a DataContract subclass, the dotted path of
+                             one, or the name of a class in pyveritas.contracts.
+                             expected_errors is optional and defaults to no errors.
         """
         if not isinstance(test_case, dict):
             raise TypeError("Test case must be a dictionary")
@@ -44,31 +97,29 @@ class TestRunner():
     def run(self):
         """Runs all test cases in the suite.
 
-        For each test case, it dynamically loads the contract class,
-        instantiates it, validates the data against the contract, and
-        prints the results.
+        For each test case, it loads the contract class (importing it when
+        given by name), instantiates it, validates the data against the
+        contract, and prints the results. Each contract is instantiated once
+        per runner and shared by the test cases that refer to it.
         """
         print(f"Running test suite: {self.name}...")
 
-        for test_case in self.test_cases:
-            description = test_case["description"]
-            contract = test_case["contract"]  # This is a string of the contract classname
-            data = test_case["data"]
-            expected_errors = test_case["expected_errors"]
-
-            # Dynamically load the contract class
-            module_name = "pyveritas.contracts"  # Assuming contracts are in pyveritas/contracts.py
-            module = importlib.import_module(module_name)
-            contract_class = getattr(module, contract)
-            contract_instance = contract_class()
-
-            validator = Validator(contract_instance)
-            errors = validator.validate(data)
-
-            if set(errors) == set(expected_errors):
-                print(f"PASSED: {description}")
-            else:
-                print(f"FAILED: {description} - Expected errors: {expected_errors}, Got: {errors}")
+        results: t.List[str] = []  # Printed together at the end rather than one write per test case
+        try:
+            for test_case in self.test_cases:
+                description = test_case["description"]
+                contract = test_case["contract"]  # A contract class, or its name or dotted path
+                data = test_case["data"]
+                expected_errors = test_case.get("expected_errors", [])  # Optional; defaults to no errors
+
+                validator = self._validators.get(contract)
+                if validator is None:
+                    validator = self._validators[contract] = Validator(_contract_class(contract)())
+                errors = validator.validate(data)
+                results.append(self._evaluate_test(description, data, errors, expected_errors))
+        finally:
+            if results:
+                print("\n".join(results))
 
         print(f"Test suite {self.name} complete.")
 
@@ -79,11 +130,18 @@ class TestRunner():
         """
         pass
 
-    def _evaluate_test(self, description: str, data: t.Dict, errors: t.List[str], expected_errors: t.List[str]):
-        """
-        Evaluates the test result and updates the test suite statistics.
+    def _evaluate_test(self, description: str, data: t.Dict, errors: t.List[str], expected_errors: t.List[str]) -> str:
+        """Evaluates the result of a test case.
+
+        Args:
+            description (str): The description of the test case.
+            data (t.Dict): The data that was validated.
+            errors (t.List[str]): The errors reported by the validator.
+            expected_errors (t.List[str]): The errors the test case expects.
+
+        Returns:
+            str: The PASSED or FAILED line that `run` prints for the test case.
         """
-        if set(errors) == set(expected_errors):
-            print(f"PASSED: {description}")
-        else:
-            print(f"FAILED: {description} - Expected errors: {expected_errors}, Got: {errors}")
\ No newline at end of file
+        if _errors_match(errors, expected_errors):
+            return f"PASSED: {description}"
+        return f"FAILED: {description} - Expected errors: {expected_errors}, Got: {errors}"
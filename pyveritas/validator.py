@@ -1,7 +1,54 @@
 from pyveritas.contracts import DataContract
-from pyveritas.rules import RuleContext
+from pyveritas.rules import (
+    Rule,
+    RuleContext,
+    RequiredRule,
+    NumberRangeRule,
+    StringLengthRule,
+    StringChoicesRule,
+    BooleanRule,
+    TypeRule,
+    EndDateAfterStartDateRule,
+    StringRegexRule,
+    HyperscanRuleSet,
+    hyperscan,
+    _HAS_NUMPY,
+    _numpy,
+    _datetime_column,
+)
 import typing as t
 
+
+def _rows_from_columns(columns: t.Dict[str, t.Sequence]) -> t.List[t.Dict]:
+    """Converts a dictionary of equal-length columns into a list of records.
+
+    NumPy arrays are converted with `tolist` so that records hold plain Python
+    values, which is what the rules expect. Datetime64 columns finer than
+    microseconds are truncated to microseconds first, so that they convert
+    to `datetime` objects rather than integers.
+
+    Args:
+        columns (t.Dict[str, t.Sequence]): The column values, keyed by field name.
+
+    Returns:
+        t.List[t.Dict]: One dictionary per row.
+
+    Raises:
+        ValueError: If the columns do not all have the same length.
+    """
+    values = []
+    for column in columns.values():
+        datetimes = _datetime_column(column) if _HAS_NUMPY and isinstance(column, _numpy().ndarray) else None
+        if datetimes is not None:
+            column = datetimes
+        values.append(column.tolist() if hasattr(column, "tolist") else list(column))
+    if len({len(column) for column in values}) > 1:
+        raise ValueError("All columns must have the same length")
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+# Rules whose `validate_column` checks a whole column at once
+_COLUMN_RULES = (NumberRangeRule, StringLengthRule, StringChoicesRule, BooleanRule, TypeRule)
+
 class Validator:
     """A simple validator class that validates data against a DataContract.
 
@@ -16,6 +63,25 @@ class Validator:
             contract (DataContract): The DataContract to use for validation.
         """
         self.contract = contract
+        self._select_rule_set()
+
+    def _select_rule_set(self):
+        """Decides how `is_valid` checks data against the contract's current rules.
+
+        Contracts made only of regular expression rules are matched in bulk
+        with Hyperscan when it is installed. The decision is made again only
+        when the contract has been recompiled since.
+        """
+        contract = self.contract
+        self._compile_count = contract._compile_count
+        self._regex_rule_set = None
+        if (
+            hyperscan is not None
+            and type(contract).validate is DataContract.validate
+            and contract.rules
+            and all(type(rule) is StringRegexRule and rule.engine == "re" for rule in contract.rules)
+        ):
+            self._regex_rule_set = HyperscanRuleSet(contract.rules)
 
     def validate(self, data: t.Dict, context: RuleContext = None) -> t.List[str]:
         """Validates the given data against the contract.
@@ -28,7 +94,7 @@ class Validator:
         Returns:
             t.List[str]: A list of error messages. If the list is empty, the data is valid.
         """
-        return self.contract.validate(data, context)
+        return self.contract(data, context)
 
     def is_valid(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Checks if the given data is valid according to the contract.
@@ -41,7 +107,75 @@ class Validator:
         Returns:
             bool: True if the data is valid, False otherwise.
         """
-        return not bool(self.validate(data, context))
+        if self._compile_count != self.contract._compile_count:
+            self._select_rule_set()
+        if self._regex_rule_set is not None:
+            return self._regex_rule_set.is_valid(data, context)
+        return not self.contract.has_any_error(data, context)
+
+    def validate_batch(self, columns: t.Union[t.Dict[str, t.Sequence], "np.ndarray"], context: RuleContext = None) -> t.List[t.List[str]]:
+        """Validates a batch of records given as columns.
+
+        Required, numeric range, string length, string choice, boolean, type and
+        date order rules are checked for the whole batch at once with NumPy when
+        their columns have a suitable dtype (range and length rules use the contract's Numba kernel
+        after `DataContract.compile_numba`); all other rules, and columns of
+        mixed types, are checked row by row. Without NumPy, or for contracts
+        that override `validate`, every row is validated individually.
+
+        Args:
+            columns (Union[t.Dict[str, t.Sequence], np.ndarray]): The column values, keyed by
+                field name, or a structured NumPy array whose field names are the record's
+                fields. All columns must have the same length.
+            context (RuleContext, optional): A RuleContext object providing additional
+                context for the validation. Defaults to None.
+
+        Returns:
+            t.List[t.List[str]]: The error messages for each row, as `validate` would return them.
+        """
+        if getattr(getattr(columns, "dtype", None), "names", None):
+            columns = {name: columns[name] for name in columns.dtype.names}
+        rows = _rows_from_columns(columns)
+        if not _HAS_NUMPY or type(self.contract).validate is not DataContract.validate:
+            return [self.validate(row, context) for row in rows]
+        np = _numpy()
+        errors: t.List[t.List[str]] = [[] for _ in rows]
+        range_kernel = self.contract._range_kernel
+        precomputed = range_kernel(columns) if range_kernel is not None else {}
+        for field_rules in self.contract._rules_by_field.values():
+            skipped = np.zeros(len(rows), dtype=bool)
+            for rule in field_rules:
+                valid = precomputed.get(rule)
+                if valid is None:
+                    valid = self._valid_mask(rule, columns, rows, context)
+                failed = ~valid & ~skipped
+                for index in np.flatnonzero(failed):
+                    errors[index].append(rule.error_message(rows[index], context))
+                if isinstance(rule, RequiredRule):
+                    skipped |= failed
+        return errors
+
+    @staticmethod
+    def _valid_mask(rule: Rule, columns: t.Dict[str, t.Sequence], rows: t.List[t.Dict], context: RuleContext = None) -> "np.ndarray":
+        """Evaluates a rule for every row, vectorizing it where possible.
+
+        Args:
+            rule (Rule): The rule to evaluate.
+            columns (t.Dict[str, t.Sequence]): The column values, keyed by field name.
+            rows (t.List[t.Dict]): The same data as one dictionary per row.
+            context (RuleContext, optional): Contextual information for the rule. Defaults to None.
+
+        Returns:
+            np.ndarray: A boolean array that is True where the row satisfies the rule.
+        """
+        np = _numpy()
+        if type(rule) is RequiredRule:
+            return np.full(len(rows), rule.field in columns)
+        if type(rule) in _COLUMN_RULES and rule.field in columns:
+            return rule.validate_column(columns[rule.field])
+        if type(rule) is EndDateAfterStartDateRule and rule.start_date_field in columns and rule.end_date_field in columns:
+            return rule.validate_columns(columns[rule.start_date_field], columns[rule.end_date_field])
+        return np.fromiter((rule.is_valid(row, context) for row in rows), dtype=bool, count=len(rows))
 
     def __call__(self, data: t.Dict, context: RuleContext = None) -> bool:
         """Allows the validator to be called like a function.
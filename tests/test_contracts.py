@@ -1,6 +1,7 @@
 # tests/test_contracts.py
 import pytest
-from pyveritas.contracts import UserContract
+from pyveritas.contracts import DataContract, UserContract
+from pyveritas.rules import BooleanRule, EmailRule, EndDateAfterStartDateRule, JSONRule, NotRule, NumberRangeRule, RequiredRule, StringChoicesRule, StringLengthRule, StringRegexRule, TypeRule
 from pyveritas.validator import Validator
 
 @pytest.fixture
@@ -31,4 +32,176 @@ def test_missing_age(validator):
     user_data = {"name": "John", "email": "test@example.com"}
     assert not validator.is_valid(user_data)
     errors = validator.validate(user_data)
-    assert "Field 'age' is required" in errors[0]
\ No newline at end of file
+    assert "Field 'age' is required" in errors[0]
+
+def test_missing_field_skips_dependent_rules(validator):
+    user_data = {"name": "John", "age": 30}
+    assert validator.validate(user_data) == ["Field 'email' is required"]
+
+
+@pytest.mark.parametrize("user_data", [
+    {"name": "John", "email": "test@example.com", "age": 30},
+    {"name": "Jo", "email": "invalid-email", "age": "invalid"},
+    {"name": None, "age": 121},
+    {},
+])
+def test_compiled_contract_matches_validate(user_contract, user_data):
+    assert user_contract(user_data) == user_contract.validate(user_data)
+
+
+
+@pytest.mark.parametrize("data", [
+    {"kind": "a", "size": 5, "name": "abc"},
+    {"kind": "b", "size": 50, "name": "abc"},
+    {"kind": "c", "size": 5, "name": "a"},
+    {"kind": "a", "name": "abcdef"},
+    {},
+])
+def test_compiled_combinators_match_validate(data):
+    contract = DataContract([
+        StringChoicesRule("kind", ["a", "b"]) & (NumberRangeRule("size", max_value=10) | RequiredRule("name")),
+        NotRule(StringLengthRule("name", max_length=2)) | StringChoicesRule("kind", ["c"]),
+        RequiredRule("size") & NotRule(NumberRangeRule("size", min_value=20)) & RequiredRule("name"),
+    ])
+    assert "check" not in contract._compiled.__code__.co_names
+    assert contract(data) == contract.validate(data)
+
+
+@pytest.mark.parametrize("data", [
+    {"code": "AB1", "count": 3, "flag": True, "ratio": 0.5, "email": "a@b.io", "payload": "[1]"},
+    {"code": "ab", "count": 30, "flag": 1, "ratio": "x", "email": "a@b", "payload": "[1"},
+    {"code": 5, "count": True, "flag": None, "ratio": None, "email": 5, "payload": None},
+    {},
+])
+def test_compiled_error_messages_match_validate(data):
+    contract = DataContract([
+        StringRegexRule("code", r"^[A-Z]+\d$"),
+        StringLengthRule("code", min_length=3),
+        NumberRangeRule("count", max_value=10),
+        BooleanRule("flag"),
+        TypeRule("ratio", (int, float)),
+        EmailRule("email"),
+        JSONRule("payload"),
+        RequiredRule("missing"),
+    ])
+    assert "check" not in contract._compiled.__code__.co_names
+    assert contract(data) == contract.validate(data)
+
+
+@pytest.mark.parametrize("data", [
+    {"name": "John", "email": "test@example.com", "age": 30},
+    {"name": "Jo", "email": "invalid-email", "age": "invalid"},
+    {"name": None, "age": 121},
+    {"kind": "a", "size": 5},
+    {},
+])
+def test_has_any_error_matches_validate(user_contract, data):
+    combinators = DataContract([
+        StringChoicesRule("kind", ["a", "b"]) | RequiredRule("name"),
+        NotRule(NumberRangeRule("size", min_value=10)),
+        EndDateAfterStartDateRule("start", "end") | RequiredRule("size"),
+    ])
+    for contract in (user_contract, combinators):
+        assert contract.has_any_error(data) == bool(contract.validate(data))
+
+
+def test_compile_picks_up_rules_modified_directly(user_contract):
+    user_contract.rules.append(RequiredRule("zip"))
+    user_contract.compile()
+    data = {"name": "John", "email": "test@example.com", "age": 30}
+    assert user_contract(data) == user_contract.validate(data) == ["Field 'zip' is required"]
+    assert user_contract.has_any_error(data)
+
+
+@pytest.mark.parametrize("call", [DataContract.validate, DataContract.__call__, DataContract.has_any_error])
+def test_rules_modified_directly_take_effect(user_contract, call):
+    data = {"name": "John", "email": "test@example.com", "age": 30}
+    user_contract.rules.append(RequiredRule("zip"))
+    assert call(user_contract, data)
+    user_contract.rules.pop()
+    assert not call(user_contract, data)
+    assert Validator(user_contract).validate_batch({field: [value] for field, value in data.items()}) == [[]]
+
+
+def test_assigning_rules_recompiles(user_contract):
+    user_contract.rules = [RequiredRule("zip")]
+    assert user_contract({}) == user_contract.validate({}) == ["Field 'zip' is required"]
+    user_contract.rules += [RequiredRule("id")]
+    assert user_contract.has_any_error({"zip": "12345"})
+
+
+class UninitialisedContract(DataContract):
+    def __init__(self):
+        pass  # Does not call DataContract.__init__
+
+    def validate(self, data, context=None):
+        return [] if "id" in data else ["Field 'id' is required"]
+
+
+def test_contract_without_base_init_can_be_called():
+    validator = Validator(UninitialisedContract())
+    assert not validator.is_valid({})
+    assert validator.is_valid({"id": 1})
+    assert validator.validate({}) == ["Field 'id' is required"]
+    assert validator.validate({"id": 1}) == []
+
+
+def test_validate_batch_matches_validate(validator):
+    np = pytest.importorskip("numpy")
+    names = ["John", "Jo", "Alexandra"]
+    emails = ["test@example.com", "invalid-email", "alex@example.org"]
+    ages = [30, 150, -1]
+    rows = [{"name": name, "email": email, "age": age} for name, email, age in zip(names, emails, ages)]
+    columns = {"name": names, "email": emails, "age": np.array(ages)}
+    assert validator.validate_batch(columns) == [validator.validate(row) for row in rows]
+
+
+
+def test_validate_batch_accepts_structured_array(validator):
+    np = pytest.importorskip("numpy")
+    records = np.array(
+        [("John", "test@example.com", 30), ("Jo", "invalid-email", 150)],
+        dtype=[("name", "U20"), ("email", "U40"), ("age", "i8")],
+    )
+    rows = [{"name": "John", "email": "test@example.com", "age": 30}, {"name": "Jo", "email": "invalid-email", "age": 150}]
+    assert validator.validate_batch(records) == [validator.validate(row) for row in rows]
+
+def test_validate_batch_with_numba_kernel(user_contract):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    user_contract.compile_numba()
+    validator = Validator(user_contract)
+    names = ["John", "Jo", "A" * 21]
+    emails = ["test@example.com", "test@example.com", "test@example.com"]
+    ages = [30.0, 150.0, float("nan")]
+    rows = [{"name": name, "email": email, "age": age} for name, email, age in zip(names, emails, ages)]
+    columns = {"name": np.array(names), "email": emails, "age": np.array(ages)}
+    assert validator.validate_batch(columns) == [validator.validate(row) for row in rows]
+
+
+
+def test_numba_kernel_keeps_large_integers_exact():
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    contract = DataContract([
+        NumberRangeRule("n", max_value=2 ** 53),
+        NumberRangeRule("m", min_value=2 ** 53 + 1),
+    ])
+    contract.compile_numba()
+    values = [2 ** 53, 2 ** 53 + 1, -(2 ** 62)]
+    columns = {"n": np.array(values, dtype=np.int64), "m": np.array(values, dtype=np.int64)}
+    expected = [contract.validate({"n": value, "m": value}) for value in values]
+    assert Validator(contract).validate_batch(columns) == expected
+    assert expected[1] == ["Field 'n' must be at most 9007199254740992"]
+
+
+@pytest.mark.parametrize("unit", ["s", "us", "ns"])
+def test_validate_batch_compares_datetime_columns(unit):
+    np = pytest.importorskip("numpy")
+    validator = Validator(DataContract([EndDateAfterStartDateRule("start", "end")]))
+    starts = np.array(["2024-01-01", "2024-01-05", "NaT", "2024-01-01"], dtype=f"datetime64[{unit}]")
+    ends = np.array(["2024-01-02", "2024-01-04", "2024-01-02", "2024-01-01"], dtype=f"datetime64[{unit}]")
+    columns = {"start": starts, "end": ends}
+    rows = [{"start": start, "end": end} for start, end in zip(starts.astype("datetime64[us]").tolist(), ends.astype("datetime64[us]").tolist())]
+    assert validator.validate_batch(columns) == [validator.validate(row) for row in rows]
+    assert [not errors for errors in validator.validate_batch(columns)] == [True, False, False, False]
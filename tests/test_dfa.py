@@ -0,0 +1,56 @@
+# tests/test_dfa.py
+import re
+import pytest
+from pyveritas.dfa import compile_dfa, UnsupportedPattern
+
+
+@pytest.mark.parametrize("regex", [
+    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+    r"^\d{3}-\d{4}$",
+    r"(?:ab|cd)*e?",
+    r"[^\s]+\w",
+    r"a{2,3}$",
+    r"x{,2}y",
+    r"a{",
+    r"^$",
+    r"",
+])
+@pytest.mark.parametrize("value", ["", "\n", "abcde", "cdabe", "555-1234", "555-1234\n", "aaa", "aaaa", "xxy", "a{", "test@example.com", "٣٣٣-٣٣٣٣"])
+def test_dfa_matches_like_re(regex, value):
+    assert compile_dfa(regex).match(value) == (re.match(regex, value) is not None)
+
+
+@pytest.mark.parametrize("regex", [r"(a)\1", r"(?=a)", r"a\b", r"a|b$", r"a$b", r"(?i)a", r"a*+"])
+def test_dfa_rejects_unsupported_syntax(regex):
+    with pytest.raises(UnsupportedPattern):
+        compile_dfa(regex)
+
+
+def test_dfa_avoids_catastrophic_backtracking():
+    assert not compile_dfa(r"^(a+)+$").match("a" * 5000 + "!")
+
+
+def _random_strings(count, length, seed):
+    import random
+    generator = random.Random(seed)
+    return ["".join(generator.choice("ab") for _ in range(length)) for _ in range(count)]
+
+
+def test_dfa_state_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr("pyveritas.dfa._MAX_DFA_STATES", 16)
+    regex = r"^[ab]*a[ab]{6}$"
+    pattern = compile_dfa(regex)
+    for value in _random_strings(300, 20, seed=1):
+        assert pattern.match(value) == (re.match(regex, value) is not None)
+        assert len(pattern._cache.states) <= 16
+
+
+def test_dfa_pattern_can_be_shared_between_threads(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    monkeypatch.setattr("pyveritas.dfa._MAX_DFA_STATES", 32)
+    regex = r"^[ab]*a[ab]{8}$"
+    pattern = compile_dfa(regex)
+    values = _random_strings(2000, 30, seed=2)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(pattern.match, values))
+    assert results == [re.match(regex, value) is not None for value in values]
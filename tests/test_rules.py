@@ -0,0 +1,419 @@
+# tests/test_rules.py
+import json
+import re
+import subprocess
+import sys
+from datetime import datetime
+import pytest
+from pyveritas.contracts import DataContract
+from pyveritas.rules import (
+    StringRegexRule,
+    HyperscanRuleSet,
+    EmailRule,
+    EMAIL_REGEX,
+    StringLengthRule,
+    StringChoicesRule,
+    NumberRangeRule,
+    RuleContext,
+    DateTimeRule,
+    DateTimeFormatRule,
+    AllOf,
+    AnyOf,
+    AndRule,
+    OrRule,
+    BooleanRule,
+    JSONRule,
+    Rule,
+    cached_validate,
+    invalidate_cached_results,
+    RequiredRule,
+    NotRule,
+    TypeRule,
+    _is_json,
+)
+from pyveritas.validator import Validator
+
+
+class CodeContract(DataContract):
+    def __init__(self):
+        super().__init__([
+            StringRegexRule(field="code", regex=r"^[A-Z]{3}$"),
+            StringRegexRule(field="code", regex=r"A"),
+            StringRegexRule(field="zip", regex=r"^\d{5}$"),
+        ])
+
+
+def test_hyperscan_rule_set_matches_re_semantics():
+    pytest.importorskip("hyperscan")
+    contract = CodeContract()
+    rule_set = HyperscanRuleSet(contract.rules)
+    records = [
+        {"code": "ABC", "zip": "12345"},
+        {"code": "BAC", "zip": "1234"},
+        {"code": "abc"},
+    ]
+    assert rule_set.validate_batch(records) == [contract.validate(record) for record in records]
+
+
+def test_validator_uses_hyperscan_for_regex_only_contracts():
+    pytest.importorskip("hyperscan")
+    validator = Validator(CodeContract())
+    assert validator._regex_rule_set is not None
+    assert validator.is_valid({"code": "ABC", "zip": "12345"})
+    assert not validator.is_valid({"code": "ABC", "zip": "12a45"})
+
+
+def test_validator_notices_rules_added_to_the_contract():
+    pytest.importorskip("hyperscan")
+    contract = CodeContract()
+    validator = Validator(contract)
+    contract.add_rule(RequiredRule("id"))
+    assert not validator.is_valid({"code": "ABC", "zip": "12345"})
+    assert validator._regex_rule_set is None
+
+
+@pytest.mark.parametrize("regex", [r"^\d+$", r"^\w+$", r"^\s$", r"^\S+$", r"^a\Z", r"^\bfoo"])
+@pytest.mark.parametrize("value", ["٣٤", "34", "é", "e", "\xa0", "\x1c", " ", "a\n", "a", "foo"])
+def test_hyperscan_validator_agrees_with_validate(regex, value):
+    pytest.importorskip("hyperscan")
+    validator = Validator(DataContract([StringRegexRule("value", regex), StringRegexRule("value", r"^.")]))
+    assert validator._regex_rule_set is not None
+    data = {"value": value}
+    assert validator.is_valid(data) == (not validator.validate(data))
+
+
+def test_hyperscan_rule_set_is_not_used_for_other_engines():
+    pytest.importorskip("hyperscan")
+    assert Validator(DataContract([StringRegexRule("value", r"^a$", engine="dfa")]))._regex_rule_set is None
+
+
+@pytest.mark.parametrize("value", [
+    "test@example.com",
+    "first.last+tag@mail.example-domain.org",
+    "test@example.com\n",
+    "test@example.com\n\n",
+    "invalid-email",
+    "@example.com",
+    "test@.com",
+    "test@example.c",
+    "test@example.c0m",
+    "test@exa@mple.com",
+    "tést@example.com",
+    "",
+    None,
+])
+def test_email_rule_matches_email_regex(value):
+    rule = EmailRule("email")
+    assert rule.is_valid({"email": value}) == (isinstance(value, str) and re.match(EMAIL_REGEX, value) is not None)
+
+
+@pytest.mark.parametrize("rule", [
+    StringLengthRule("value", min_length=2, max_length=4),
+    StringLengthRule("value", min_length=2),
+    StringRegexRule("value", r"^a+$"),
+    EmailRule("value"),
+    StringChoicesRule("value", ["a", "abc"]),
+    NumberRangeRule("value", min_value=0, max_value=10),
+    RequiredRule("value"),
+    DateTimeFormatRule("value", "%Y-%m-%d"),
+    BooleanRule("value"),
+    JSONRule("value"),
+])
+@pytest.mark.parametrize("data", [{"value": "abc"}, {"value": "a"}, {"value": 5}, {"value": 50}, {"value": "2024-01-31"}, {"value": True}, {}])
+def test_check_matches_is_valid_and_error_message(rule, data):
+    expected = None if rule.is_valid(data) else rule.error_message(data)
+    assert rule.check(data) == expected
+
+
+@pytest.mark.parametrize("min_value, max_value", [(0, 10), (0, None), (None, 10), (None, None)])
+def test_validate_column_matches_is_valid(min_value, max_value):
+    pytest.importorskip("numpy")
+    rule = NumberRangeRule("value", min_value=min_value, max_value=max_value)
+    values = [-1, 0, 5.5, 10, 11, float("nan")]
+    expected = [rule.is_valid({"value": value}) for value in values]
+    assert rule.validate_column(values).tolist() == expected
+
+
+def test_rule_context_default_is_not_shared_mutable_state():
+    first, second = RuleContext(), RuleContext()
+    with pytest.raises(TypeError):
+        first.context["key"] = "value"
+    assert dict(second.context) == {}
+    assert str(first) == "{}"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2024-01-31", True),
+    ("20240131", True),
+    ("2024W05", True),
+    ("2024-01-31T12:30:00+00:00", True),
+    ("2024-13-01", False),
+    ("31/01/2024", False),
+    ("2024", False),
+    ("", False),
+])
+def test_datetime_rule_parses_iso_strings(value, expected):
+    rule = DateTimeRule("value")
+    assert (rule._get_value({"value": value}) is not None) == expected
+
+
+@pytest.mark.parametrize("format_string", ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M"])
+@pytest.mark.parametrize("value", [
+    "2024-02-29", "2023-02-29", "2024-13-01", "0000-01-01",
+    "2024-01-31T23:59:59", "2024-01-31T24:00:00", "2024-01-31T12:60:00", "2024-01-31t12:30:00",
+    "2024-01-31 12:30", "2024-1-31", "２０２４-01-31",
+])
+def test_datetime_format_rule_iso_fast_path_matches_strptime(format_string, value):
+    try:
+        datetime.strptime(value, format_string)
+        expected = True
+    except ValueError:
+        expected = False
+    assert DateTimeFormatRule("value", format_string).is_valid({"value": value}) == expected
+
+
+@pytest.mark.parametrize("format_string, value, expected", [
+    ("%Y-%m-%d", "2024-01-31", True),
+    ("%Y-%m-%d", "2024-01-31T12:30:00", False),
+    ("%Y-%m-%d", "31/01/2024", False),
+    ("%d/%m/%Y", "31/01/2024", True),
+    ("%d/%m/%Y", "2024-01-31", False),
+    ("%d/%m/%Y", datetime(2024, 1, 31), True),
+])
+def test_datetime_format_rule_parses_with_its_format(format_string, value, expected):
+    rule = DateTimeFormatRule("value", format_string)
+    assert rule.is_valid({"value": value}) == expected
+    assert (rule.check({"value": value}) is None) == expected
+
+
+def test_combinator_chains_are_flattened():
+    rules = [NumberRangeRule("value", min_value=0), NumberRangeRule("value", max_value=10), RequiredRule("value")]
+    all_of = rules[0] & rules[1] & rules[2]
+    any_of = (rules[0] | rules[1]) | rules[2]
+    assert type(all_of) is AllOf and all_of.children == tuple(rules)
+    assert type(any_of) is AnyOf and any_of.children == tuple(rules)
+    assert all_of.is_valid({"value": 5}) and not all_of.is_valid({"value": 11})
+    assert all_of.error_message({"value": 11}) == "Field 'value' must be at most 10"
+    assert any_of.error_message({}).startswith("All rules failed: ")
+
+
+def test_binary_combinators_keep_their_interface():
+    first, second = RequiredRule("a"), RequiredRule("b")
+    and_rule, or_rule = first & second, first | second
+    assert type(and_rule) is AndRule and (and_rule.rule1, and_rule.rule2) == (first, second)
+    assert type(or_rule) is OrRule and (or_rule.rule1, or_rule.rule2) == (first, second)
+    assert or_rule.error_message({}) == "Both rules failed: Field 'a' is required OR Field 'b' is required"
+
+
+def test_boolean_rule():
+    rule = BooleanRule("flag")
+    assert rule.is_valid({"flag": False})
+    assert not rule.is_valid({"flag": "yes"})
+    assert rule.check({}) == "Field 'flag' must be a boolean"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ('{"a": [1, 2]}', True),
+    ("NaN", True),
+    ('"\\ud800"', True),
+    ("123456789012345678901234567890", True),
+    ("{'a': 1}", False),
+    ('{"a": 1,}', False),
+    ("", False),
+    (1, False),
+])
+def test_json_rule(value, expected):
+    rule = JSONRule("payload")
+    assert rule.is_valid({"payload": value}) == expected
+    assert rule.check({"payload": value}) == (None if expected else "Field 'payload' must contain valid JSON")
+
+
+@pytest.mark.parametrize("value", [
+    "NaN", "[Infinity]", '{"a": -Infinity}', "1e400", "18446744073709551616", "-9223372036854775809",
+    '"\\udc00"', '"\ud800"', "[NaN,]", "Infinity}", "18446744073709551616 1",
+])
+def test_json_rule_agrees_with_json(value):
+    try:
+        json.loads(value)
+        expected = True
+    except json.JSONDecodeError:
+        expected = False
+    assert JSONRule("payload").is_valid({"payload": value}) == expected
+
+
+def test_invalid_json_is_parsed_once(monkeypatch):
+    pytest.importorskip("orjson")
+    monkeypatch.setattr(json, "loads", pytest.fail)
+    _is_json.cache_clear()
+    assert not JSONRule("payload").is_valid({"payload": '{"a": 1,}'})
+
+
+class CountingRule(Rule):
+    def __init__(self):
+        self.calls = 0
+
+    @cached_validate
+    def is_valid(self, data, context=None):
+        self.calls += 1
+        return data.get("value") == 1
+
+    def error_message(self, data, context=None):
+        return "Field 'value' must be 1"
+
+
+def test_cached_validate_reuses_results_for_the_same_data():
+    rule = CountingRule()
+    data = {"value": 2}
+    combined = rule | RequiredRule("missing")
+    assert combined.check(data) == "Both rules failed: Field 'value' must be 1 OR Field 'missing' is required"
+    assert rule.calls == 1
+    data["value"] = 1
+    assert not rule.is_valid(data)
+    invalidate_cached_results()
+    assert rule.is_valid(data) and rule.calls == 2
+
+
+def test_cached_validate_is_thread_safe():
+    import threading
+    rule = CountingRule()
+    hot_records = [{"value": 1} for _ in range(256)]  # Fill the cache, so that hits land on the oldest entries
+    failures = []
+
+    def run(check):
+        try:
+            check()
+        except Exception as error:
+            failures.append(error)
+
+    def read():
+        for _ in range(200):
+            assert all(rule.is_valid(record) for record in hot_records)
+
+    def evict():
+        for _ in range(200 * 256):
+            assert not rule.is_valid({"value": 2})
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Switch threads often, between the cache's bookkeeping steps
+    try:
+        threads = [threading.Thread(target=run, args=(check,)) for check in (read, read, evict, evict)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert failures == []
+
+
+@pytest.mark.parametrize("data", [{"value": 5}, {"value": 50}, {"value": "abc"}, {}])
+def test_combinator_check_matches_is_valid_and_error_message(data):
+    small, large = NumberRangeRule("value", max_value=10), NumberRangeRule("value", min_value=20)
+    for rule in [small & large, small | large, (small | large) & RequiredRule("value"), small | large | RequiredRule("other")]:
+        expected = None if rule.is_valid(data) else rule.error_message(data)
+        assert rule.check(data) == expected
+
+
+@pytest.mark.parametrize("regex", ["^active$", "active$", "^ID-", "ID-", "", "^$", "a.b", r"^a\$"])
+@pytest.mark.parametrize("value", ["active", "active\n", "active\n\n", "inactive", "ID-42", "xID-", "", "\n", "a.b", "axb", "a$"])
+def test_literal_patterns_match_like_re(regex, value):
+    rule = StringRegexRule("value", regex)
+    assert rule.is_valid({"value": value}) == (re.match(regex, value) is not None)
+
+
+def test_validator_notices_rules_added_to_the_contract():
+    pytest.importorskip("hyperscan")
+    contract = CodeContract()
+    validator = Validator(contract)
+    contract.add_rule(RequiredRule("id"))
+    assert not validator.is_valid({"code": "ABC", "zip": "12345"})
+    assert validator._regex_rule_set is None
+
+
+@pytest.mark.parametrize("regex", [r"^\d+$", r"^\d*$", r"^\d{5}$", r"\d{2,4}$", r"^\d{2,}$", r"^[0-9]+$", r"^[0-9]{5}$"])
+@pytest.mark.parametrize("value", ["", "\n", "7", "12345", "12345\n", "12345\n\n", "123456", "12a45", "١٢٣٤٥", "12²", " 123"])
+def test_digit_patterns_match_like_re(regex, value):
+    rule = StringRegexRule("value", regex)
+    assert rule._match is not rule._pattern.match
+    assert rule.is_valid({"value": value}) == (re.match(regex, value) is not None)
+
+
+@pytest.mark.parametrize("engine", ["re", "re2", "pcre2", "dfa"])
+@pytest.mark.parametrize("regex", ["^active$", r"^[a-z]+\d{2}$", r"^(a)\1$"])
+@pytest.mark.parametrize("value", ["active", "abc12", "abc12\n", "aa", "ab"])
+def test_regex_engines_agree_with_re(engine, regex, value):
+    if engine in ("re2", "pcre2"):
+        pytest.importorskip({"re2": "re2", "pcre2": "pcre2"}[engine])
+    rule = StringRegexRule("value", regex, engine=engine)
+    expected = re.match(regex, value) is not None
+    if engine == "re2" and value.endswith("\n"):
+        expected = False  # re2's `$` does not match before a trailing newline
+    assert rule.is_valid({"value": value}) == expected
+
+
+@pytest.mark.parametrize("engine", ["re", "re2", "pcre2", "dfa"])
+def test_rules_share_compiled_patterns(engine):
+    if engine in ("re2", "pcre2"):
+        pytest.importorskip(engine)
+    first, second = StringRegexRule("a", r"^[a-z]+-\d+$", engine=engine), StringRegexRule("b", r"^[a-z]+-\d+$", engine=engine)
+    assert first._pattern is second._pattern
+    assert first._pattern is not StringRegexRule("a", r"^[a-z]+$", engine=engine)._pattern
+
+
+def test_unknown_regex_engine():
+    with pytest.raises(ValueError):
+        StringRegexRule("value", "^a$", engine="perl")
+
+
+@pytest.mark.parametrize("rule, values", [
+    (StringLengthRule("value", min_length=2, max_length=4), ["a", "ab", "abcd", "abcde"]),
+    (StringLengthRule("value", min_length=2), ["a", "ab", None, 3]),
+    (StringLengthRule("value", min_length=1), ["ab", 3]),
+    (StringChoicesRule("value", ["red", "green"]), ["red", "blue", "green", ""]),
+    (StringChoicesRule("value", ["red", "green"]), ["red", None, 1]),
+    (BooleanRule("value"), [True, False]),
+    (BooleanRule("value"), [True, 0, None]),
+    (NumberRangeRule("value", min_value=0, max_value=10), [1, "5", None, 11]),
+    (NumberRangeRule("value", min_value=0, max_value=10), [True, 1, 2.5]),
+    (NumberRangeRule("value", min_value=0, max_value=10), [True, False]),
+    (TypeRule("value", int), [1, 2]),
+    (TypeRule("value", int), [True, False]),
+    (TypeRule("value", float), [1, 2]),
+    (TypeRule("value", (int, float)), [1.5, 2.0]),
+    (TypeRule("value", str), ["a", "b"]),
+    (TypeRule("value", int), [1, "a", None]),
+])
+def test_validate_column_matches_is_valid_for_all_dtypes(rule, values):
+    pytest.importorskip("numpy")
+    expected = [rule.is_valid({"value": value}) for value in values]
+    assert rule.validate_column(values).tolist() == expected
+
+
+def test_field_names_are_interned():
+    field = "".join(["user", "_name"])
+    assert RequiredRule(field).field is sys.intern("user_name")
+    assert StringLengthRule(field, min_length=1).is_valid({"user_name": "a"})
+    assert RequiredRule(7).is_valid({7: None})
+
+
+@pytest.mark.parametrize("value", [True, False])
+def test_number_rules_reject_booleans(value):
+    rule = NumberRangeRule("value", min_value=0, max_value=10)
+    contract = DataContract([rule])
+    assert not rule.is_valid({"value": value})
+    assert rule.check({"value": value}) == rule.error_message({"value": value}) == "Field 'value' must be a number"
+    assert contract({"value": value}) == contract.validate({"value": value}) == ["Field 'value' must be a number"]
+
+
+def test_double_negation_is_folded():
+    rule = RequiredRule("value")
+    assert ~~rule is rule
+    assert type(~rule) is NotRule and (~rule).rule is rule
+    assert not (~rule).is_valid({"value": 1}) and (~rule).is_valid({})
+
+
+def test_importing_the_package_does_not_load_numpy():
+    pytest.importorskip("numpy")
+    code = "import sys, pyveritas; pyveritas.UserContract()({'age': 3}); print('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
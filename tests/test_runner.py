@@ -0,0 +1,65 @@
+# tests/test_runner.py
+import pytest
+from pyveritas import runner
+from pyveritas.contracts import DataContract
+from pyveritas.rules import RequiredRule
+
+
+def test_runner_reports_passed_and_failed_cases(capsys):
+    suite = runner.TestRunner("users")
+    suite.add({
+        "description": "valid user",
+        "contract": "UserContract",
+        "data": {"name": "John", "email": "test@example.com", "age": 30},
+        "expected_errors": [],
+    })
+    suite.add({
+        "description": "missing email",
+        "contract": "UserContract",
+        "data": {"name": "John", "age": 30},
+        "expected_errors": ["Field 'email' is required"],
+    })
+    suite.add({
+        "description": "wrong expectation",
+        "contract": "UserContract",
+        "data": {"name": "John", "email": "test@example.com", "age": 30},
+        "expected_errors": ["Field 'age' is required"],
+    })
+    suite.run()
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == "Running test suite: users..."
+    assert output[1:3] == ["PASSED: valid user", "PASSED: missing email"]
+    assert output[3].startswith("FAILED: wrong expectation")
+    assert output[4] == "Test suite users complete."
+
+
+class NameContract(DataContract):
+    def __init__(self):
+        super().__init__([RequiredRule("name")])
+
+
+@pytest.mark.parametrize("contract", [NameContract, "tests.test_runner.NameContract"])
+def test_runner_accepts_contract_classes_and_dotted_paths(contract, capsys):
+    suite = runner.TestRunner("names")
+    suite.add({"description": "named", "contract": contract, "data": {"name": "John"}, "expected_errors": []})
+    suite.add({"description": "unnamed", "contract": contract, "data": {}, "expected_errors": ["Field 'name' is required"]})
+    suite.run()
+    assert capsys.readouterr().out.splitlines()[1:3] == ["PASSED: named", "PASSED: unnamed"]
+
+
+def test_runner_expects_no_errors_by_default(capsys):
+    suite = runner.TestRunner("defaults")
+    suite.add({"description": "valid", "contract": NameContract, "data": {"name": "John"}})
+    suite.add({"description": "invalid", "contract": NameContract, "data": {}})
+    suite.run()
+    output = capsys.readouterr().out.splitlines()
+    assert output[1] == "PASSED: valid"
+    assert output[2].startswith("FAILED: invalid")
+
+
+def test_runner_add_rejects_incomplete_cases():
+    suite = runner.TestRunner("incomplete")
+    with pytest.raises(ValueError, match="'contract'"):
+        suite.add({"description": "no contract", "data": {}})
+    with pytest.raises(TypeError):
+        suite.add(["description", "contract", "data"])